@@ -2,7 +2,8 @@
 Card representation and utilities for the Gamba card game.
 """
 
-from typing import List, Optional
+from operator import attrgetter
+from typing import Dict, List, Optional
 from utils.constants import (
     VALID_RANKS,
     VALID_SUITS,
@@ -13,6 +14,26 @@ from utils.constants import (
     EMPTY_PILE_MARKER
 )
 
+_VALID_SUITS = frozenset(VALID_SUITS)
+_rank_value = CARD_VALUES.get  # Rank -> value (None for unknown ranks), also validates the rank
+_by_value = attrgetter('value')  # Sort key
+
+# Suit symbols for display
+_SUIT_SYMBOLS = {
+    'H': '♥',
+    'D': '♦',
+    'C': '♣',
+    'S': '♠'
+}
+
+# Card property bits (Card._flags) - predicates become a single int test
+_WILD = 0x01     # 2
+_SEVEN = 0x02    # 7
+_TEN = 0x04      # 10
+_EMPTY = 0x08    # 1S empty pile marker
+_SPECIAL = _WILD | _SEVEN | _TEN
+_VALUE_FLAGS = {CARD_VALUE_TWO: _WILD, CARD_VALUE_SEVEN: _SEVEN, CARD_VALUE_TEN: _TEN}
+
 
 class Card:
     """
@@ -28,9 +49,38 @@ class Card:
     - 1S: Empty pile marker (not a real card)
     """
     
-    def __init__(self, code: str):
+    __slots__ = ('code', 'suit', 'rank', 'value', '_flags', '_bit', '_str')
+    
+    _CACHE: Dict[str, 'Card'] = {}  # Code -> shared instance (see __new__)
+    
+    def __new__(cls, code: str):
+        """
+        Return the shared card for a code string, creating it on first use.
+        
+        Cards are immutable, so every Card("2H") is the same object; the
+        52 real cards and the 1S marker are created at import time.
+        
+        Args:
+            code: Card code (e.g., "2H", "AS", "10D")
+            
+        Raises:
+            ValueError: If code format is invalid
+        """
+        card = cls._CACHE.get(code)
+        if card is None:
+            card = super().__new__(cls)
+            card._parse(code)
+            card._bit = 1 << len(cls._CACHE)  # Unique per card - for hand bitmasks
+            cls._CACHE[code] = card
+        return card
+    
+    @classmethod
+    def get(cls, code: str) -> 'Card':
         """
-        Initialize card from code string.
+        Get the shared card for a code string.
+        
+        Same result as Card(code), but a known code is a single dict lookup
+        (no __new__ call); unknown codes go through Card() to parse/raise.
         
         Args:
             code: Card code (e.g., "2H", "AS", "10D")
@@ -38,6 +88,10 @@ class Card:
         Raises:
             ValueError: If code format is invalid
         """
+        return cls._CACHE.get(code) or cls(code)
+    
+    def _parse(self, code: str):
+        """Parse and validate the code - runs once per distinct code"""
         self.code = code.upper()
         
         # Parse rank and suit
@@ -47,34 +101,40 @@ class Card:
         self.suit = code[-1]  # Last character is suit
         self.rank = code[:-1]  # Everything else is rank
         
-        # Validate
-        if self.rank not in VALID_RANKS and code != EMPTY_PILE_MARKER:
-            raise ValueError(f"Invalid rank: {self.rank}")
-        if self.suit not in VALID_SUITS:
+        # Validate and get numeric value with a single rank lookup
+        value = _rank_value(self.rank)
+        if value is None:
+            if code != EMPTY_PILE_MARKER:
+                raise ValueError(f"Invalid rank: {self.rank}")
+            value = 0
+        if self.suit not in _VALID_SUITS:
             raise ValueError(f"Invalid suit: {self.suit}")
         
-        # Get numeric value
-        self.value = CARD_VALUES.get(self.rank, 0)
+        self.value = value
+        self._flags = _VALUE_FLAGS.get(value, 0) | (_EMPTY if self.code == EMPTY_PILE_MARKER else 0)
+        
+        # Display string (suit symbol instead of letter), built once
+        self._str = f"{self.rank}{_SUIT_SYMBOLS.get(self.suit, self.suit)}"
     
     def is_special(self) -> bool:
         """Check if this is a special card (2, 7, or 10)"""
-        return self.value in [CARD_VALUE_TWO, CARD_VALUE_SEVEN, CARD_VALUE_TEN]
+        return bool(self._flags & _SPECIAL)
     
     def is_wild(self) -> bool:
         """Check if this is a wild card (2)"""
-        return self.value == CARD_VALUE_TWO
+        return bool(self._flags & _WILD)
     
     def is_seven(self) -> bool:
         """Check if this is a seven (forces ≤7)"""
-        return self.value == CARD_VALUE_SEVEN
+        return bool(self._flags & _SEVEN)
     
     def is_ten(self) -> bool:
         """Check if this is a ten (burns pile)"""
-        return self.value == CARD_VALUE_TEN
+        return bool(self._flags & _TEN)
     
     def is_empty_marker(self) -> bool:
         """Check if this is the empty pile marker (1S)"""
-        return self.code == EMPTY_PILE_MARKER
+        return bool(self._flags & _EMPTY)
     
     def can_play_on(self, top_card: 'Card', must_play_low: bool = False) -> bool:
         """
@@ -87,17 +147,17 @@ class Card:
         Returns:
             True if this card can be played
         """
+        flags = self._flags
+        top_flags = top_card._flags
+        
         # Special case: empty pile (1S) - any card can be played
-        if top_card.is_empty_marker():
+        if top_flags & _EMPTY:
             if must_play_low:
-                return self.value <= CARD_VALUE_SEVEN or self.is_wild()
+                return self.value <= CARD_VALUE_SEVEN or bool(flags & _WILD)
             return True
         
-        # Special card: 2 (wild) can always be played
-        if self.is_wild():
-            return True
-
-        if self.is_ten():
+        # Special cards: 2 (wild) and 10 (burn) can always be played
+        if flags & (_WILD | _TEN):
             return True
         
         # If must_play_low is active, only ≤7 cards (or wild) allowed
@@ -106,7 +166,7 @@ class Card:
         
         # Normal rule: play same or higher value
         # Special case: anything can be played on a 2
-        if top_card.is_wild():
+        if top_flags & _WILD:
             return True
         
         # Regular play: same or higher value
@@ -114,6 +174,8 @@ class Card:
     
     def __eq__(self, other):
         """Check if two cards are equal"""
+        if self is other:
+            return True  # Shared instances - the common case
         if not isinstance(other, Card):
             return False
         return self.code == other.code
@@ -122,21 +184,17 @@ class Card:
         """Make Card hashable (for use in sets/dicts)"""
         return hash(self.code)
     
+    def __reduce__(self):
+        """Copy/pickle through the constructor so the flyweight cache is used"""
+        return (Card, (self.code,))
+    
     def __repr__(self):
         """String representation for debugging"""
         return f"Card({self.code})"
     
     def __str__(self):
         """String representation for display"""
-        # Add suit symbols for better display
-        suit_symbols = {
-            'H': '♥',
-            'D': '♦',
-            'C': '♣',
-            'S': '♠'
-        }
-        symbol = suit_symbols.get(self.suit, self.suit)
-        return f"{self.rank}{symbol}"
+        return self._str
     
     @staticmethod
     def parse_card_list(cards_str: str) -> List['Card']:
@@ -155,12 +213,12 @@ class Card:
         if not cards_str or cards_str.strip() == "":
             return []
         
-        card_codes = [code.strip() for code in cards_str.split(',')]
-        # 1. Create the list of card objects
-        card_list = [Card(code) for code in card_codes if code]
+        # 1. Create the list of card objects (shared instances from the cache)
+        get = Card.get
+        card_list = [get(code) for code in map(str.strip, cards_str.split(',')) if code]
         
         # 2. Sort the list in-place using the card's 'value' attribute
-        card_list.sort(key=lambda card: card.value)
+        card_list.sort(key=_by_value)
         
         # 3. Return the now-sorted list
         return card_list
@@ -198,6 +256,40 @@ class Card:
         first_rank = cards[0].rank
         return all(card.rank == first_rank for card in cards)
     
+    @staticmethod
+    def playable_cards(cards: List['Card'], top_card: 'Card',
+                       must_play_low: bool = False) -> List['Card']:
+        """
+        Filter cards down to those that can be played on top_card.
+        
+        Same rules as can_play_on, but the top card and must_play_low are
+        reduced once to an "always playable" flag mask plus a value range,
+        so each card costs one flag test and one range check.
+        
+        Args:
+            cards: Cards to filter (e.g. a player's hand)
+            top_card: The current top card on the pile
+            must_play_low: If True, must play a card with value ≤7
+            
+        Returns:
+            Playable cards, in their original order
+        """
+        top_flags = top_card._flags
+        low, high = 0, CARD_VALUES["A"]
+        if top_flags & _EMPTY:
+            if not must_play_low:
+                return list(cards)
+            always, high = _WILD, CARD_VALUE_SEVEN
+        elif must_play_low:
+            always, high = _WILD | _TEN, CARD_VALUE_SEVEN
+        elif top_flags & _WILD:
+            return list(cards)
+        else:
+            always, low = _WILD | _TEN, top_card.value
+        
+        return [card for card in cards
+                if card._flags & always or low <= card.value <= high]
+    
     @staticmethod
     def sort_by_value(cards: List['Card']) -> List['Card']:
         """
@@ -209,7 +301,15 @@ class Card:
         Returns:
             Sorted list of cards
         """
-        return sorted(cards, key=lambda c: c.value)
+        return sorted(cards, key=_by_value)
+
+
+# Pre-warm the cache with the full deck plus the empty pile marker
+for _rank in VALID_RANKS:
+    for _suit in VALID_SUITS:
+        Card(_rank + _suit)
+Card(EMPTY_PILE_MARKER)
+del _rank, _suit
 
 
 # Convenience function
@@ -2,16 +2,25 @@
 Player state tracking for the Gamba card game.
 """
 
+from functools import reduce
+from operator import or_
 from typing import List, Optional
 from .card import Card
 
 
+def _card_mask(cards: List[Card]) -> int:
+    """OR of the cards' bits (Card._bit)"""
+    return reduce(or_, [card._bit for card in cards], 0)
+
+
 class Player:
     """
     Represents a player in the game.
     Tracks hand, reserves, and connection status.
     """
     
+    __slots__ = ('name', 'hand', '_hand_bits', 'reserves_count', 'is_current_player', 'is_connected')
+    
     def __init__(self, name: str):
         """
         Initialize player.
@@ -21,6 +30,7 @@ class Player:
         """
         self.name = name
         self.hand: List[Card] = []
+        self._hand_bits: int = 0  # Bitmask of the cards in hand - O(1) membership tests
         self.reserves_count: int = 0
         self.is_current_player: bool = False
         self.is_connected: bool = True
@@ -28,6 +38,7 @@ class Player:
     def set_hand(self, cards: List[Card]):
         """Set player's hand"""
         self.hand = cards.copy()
+        self._hand_bits = _card_mask(self.hand)
     
     def set_hand_from_string(self, cards_str: str):
         """
@@ -40,10 +51,12 @@ class Player:
             self.hand = Card.parse_card_list(cards_str)
         else:
             self.hand = []
+        self._hand_bits = _card_mask(self.hand)
     
     def add_cards_to_hand(self, cards: List[Card]):
         """Add cards to hand"""
         self.hand.extend(cards)
+        self._hand_bits |= _card_mask(cards)
     
     def remove_cards_from_hand(self, cards: List[Card]) -> bool:
         """
@@ -56,19 +69,21 @@ class Player:
             True if all cards were found and removed
         """
         for card in cards:
-            if card in self.hand:
+            if self._hand_bits & card._bit:
                 self.hand.remove(card)
+                self._hand_bits &= ~card._bit
             else:
                 return False  # Card not in hand
         return True
     
     def has_card(self, card: Card) -> bool:
         """Check if player has a specific card"""
-        return card in self.hand
+        return bool(self._hand_bits & card._bit)
     
     def has_cards(self, cards: List[Card]) -> bool:
         """Check if player has all specified cards"""
-        return all(card in self.hand for card in cards)
+        mask = _card_mask(cards)
+        return self._hand_bits & mask == mask
     
     def get_hand_size(self) -> int:
         """Get number of cards in hand"""
@@ -77,6 +92,7 @@ class Player:
     def clear_hand(self):
         """Remove all cards from hand"""
         self.hand.clear()
+        self._hand_bits = 0
     
     def has_won(self) -> bool:
         """
@@ -100,7 +116,7 @@ class Player:
         Returns:
             List of playable cards
         """
-        return [card for card in self.hand if card.can_play_on(top_card, must_play_low)]
+        return Card.playable_cards(self.hand, top_card, must_play_low)
     
     def can_play_any_card(self, top_card: Card, must_play_low: bool = False) -> bool:
         """
@@ -113,7 +129,9 @@ class Player:
         Returns:
             True if at least one card can be played
         """
-        return len(self.get_playable_cards(top_card, must_play_low)) > 0
+        # Stops at the first playable card instead of building the full list
+        can_play_on = Card.can_play_on
+        return any(can_play_on(card, top_card, must_play_low) for card in self.hand)
     
     def to_dict(self) -> dict:
         """
@@ -147,6 +165,8 @@ class OpponentPlayer:
     We don't know their hand, only hand size.
     """
     
+    __slots__ = ('name', 'hand_size', 'reserves_count', 'is_current_player', 'is_connected')
+    
     def __init__(self, name: str):
         """
         Initialize opponent.
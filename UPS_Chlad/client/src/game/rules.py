@@ -3,11 +3,14 @@ Game rules validation for the Gamba card game.
 Checks if moves are valid according to game rules.
 """
 
+from operator import attrgetter
 from typing import List, Tuple, Optional
 from .card import Card
 from .player import Player
 from utils.constants import RESERVE_KEYWORD
 
+_by_value = attrgetter('value')
+
 
 class GameRules:
     """
@@ -165,9 +168,8 @@ class GameRules:
         if not playable:
             return None
         
-        # Sort by value and return lowest
-        sorted_cards = Card.sort_by_value(playable)
-        lowest = sorted_cards[0]
+        # Lowest value (single pass - no need to sort the whole list)
+        lowest = min(playable, key=_by_value)
         
         # Check if we can play multiple of same rank
         same_rank = [c for c in playable if c.rank == lowest.rank]
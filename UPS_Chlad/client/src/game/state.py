@@ -12,12 +12,62 @@ from utils.constants import EMPTY_PILE_MARKER
 from utils import constants
 
 
+def _set_hand(state: 'GameState', value: str):
+    """Update player's hand"""
+    state.player.set_hand_from_string(value)
+
+
+def _set_reserves(state: 'GameState', value: str):
+    """Update reserves"""
+    state.player.reserves_count = int(value)
+
+
+def _set_top_card(state: 'GameState', value: str):
+    """Update top card"""
+    try:
+        state.top_card = Card.get(value)
+    except ValueError:
+        # Invalid card, use empty marker
+        state.top_card = Card.get(EMPTY_PILE_MARKER)
+
+
+def _set_must_play_low(state: 'GameState', value: str):
+    """Update must_play_low flag (accepts "true"/"false" and "1"/"0")"""
+    state.must_play_low = (value == '1' or value.lower() == 'true')
+
+
+def _set_deck_size(state: 'GameState', value: str):
+    """Update deck size"""
+    state.deck_size = int(value)
+
+
+def _set_discard_pile_size(state: 'GameState', value: str):
+    """Update discard pile size"""
+    state.discard_pile_size = int(value)
+
+
 class GameState:
     """
     Maintains complete game state.
     Can serialize/restore for reconnection.
     """
     
+    __slots__ = (
+        'player_name', 'room_id', 'player', 'opponent',
+        'top_card', 'must_play_low', 'current_player_name', 'deck_size', 'discard_pile_size',
+        'last_update', 'connection_state', 'in_game',
+    )
+    
+    # Message field -> setter for fields that don't depend on each other
+    _FIELD_SETTERS = {
+        'hand': _set_hand,
+        'reserves': _set_reserves,
+        'top_card': _set_top_card,
+        'must_play_low': _set_must_play_low,
+        'deck_size': _set_deck_size,
+        'discard_pile_size': _set_discard_pile_size,
+    }
+    
     def __init__(self):
         """Initialize empty game state"""
         # Connection info
@@ -37,7 +87,7 @@ class GameState:
         
         # Meta state
         self.last_update: Optional[datetime] = None
-        self.connection_state: str = constants.STATE_DISCONNECTED
+        self.connection_state: int = constants.STATE_DISCONNECTED
         self.in_game: bool = False
     
     def initialize_player(self, name: str):
@@ -62,14 +112,13 @@ class GameState:
         if not self.player:
             self.initialize_player(data.get('player_id', 'Unknown'))
 
-        # Update player's hand (if present)
-        if 'hand' in data:
-            hand_str = data.get('hand', '')
-            self.player.set_hand_from_string(hand_str)
-
-        # Update reserves (if present)
-        if 'reserves' in data:
-            self.player.reserves_count = int(data.get('reserves', 0))
+        # Independent fields (hand, reserves, top card, flags, pile sizes):
+        # one table lookup per key actually present in the message
+        setters = self._FIELD_SETTERS
+        for key, value in data.items():
+            setter = setters.get(key)
+            if setter is not None:
+                setter(self, value)
 
         # Update current player - handle both methods:
         # 1. Old method: current_player field (full state)
@@ -94,27 +143,6 @@ class GameState:
             self.current_player_name = data.get('current_player', '')
             self.player.is_current_player = (self.current_player_name == self.player_name)
 
-        # Update top card (if present)
-        if 'top_card' in data:
-            top_card_str = data.get('top_card', EMPTY_PILE_MARKER)
-            try:
-                self.top_card = Card(top_card_str)
-            except ValueError:
-                # Invalid card, use empty marker
-                self.top_card = Card(EMPTY_PILE_MARKER)
-
-        # Update must_play_low flag (if present)
-        # Handle both "true"/"false" strings and "1"/"0"
-        if 'must_play_low' in data:
-            ml_value = data.get('must_play_low', '0')
-            self.must_play_low = (ml_value == '1' or ml_value.lower() == 'true')
-
-        # Update pile info (if present)
-        if 'deck_size' in data:
-            self.deck_size = int(data.get('deck_size', 0))
-        if 'discard_pile_size' in data:
-            self.discard_pile_size = int(data.get('discard_pile_size', 0))
-
         # Update opponent (if present)
         opponent_name = data.get('opponent_name', '')
         if opponent_name:
@@ -243,7 +271,7 @@ class GameState:
         top_card_code = data.get('top_card')
         if top_card_code:
             try:
-                self.top_card = Card(top_card_code)
+                self.top_card = Card.get(top_card_code)
             except ValueError:
                 self.top_card = None
         
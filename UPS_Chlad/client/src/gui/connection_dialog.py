@@ -88,7 +88,7 @@ class ConnectionDialog(QDialog):
         # Player name input
         self.name_input = QLineEdit()
         self.name_input.setPlaceholderText("Enter your name")
-        self.name_input.setMaxLength(32)  # Server limit
+        self.name_input.setMaxLength(constants.MAX_PLAYER_NAME_LENGTH)  # Server limit
         self.name_input.setToolTip("Your player name (alphanumeric, _, - only)")
         player_layout.addRow("Player Name:", self.name_input)
         
@@ -186,11 +186,11 @@ class ConnectionDialog(QDialog):
         if not name:
             return False, "Please enter your player name"
         
-        if len(name) > 32:
-            return False, "Name must be 32 characters or less"
+        if len(name) > constants.MAX_PLAYER_NAME_LENGTH:
+            return False, f"Name must be {constants.MAX_PLAYER_NAME_LENGTH} characters or less"
         
-        # Check for valid characters (alphanumeric, underscore, hyphen)
-        if not all(c.isalnum() or c in ('_', '-') for c in name):
+        # Check for valid characters (alphanumeric, underscore, hyphen) in one C-level pass
+        if name.translate(constants.VALID_NAME_CHARS_DELETE):
             return False, "Name can only contain letters, numbers, _ and -"
         
         return True, ""
@@ -17,6 +17,7 @@ from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtGui import QFont
 
 from game import Card, GameState, GameRules
+from utils import constants
 from .widgets import CardWidget, EmptyCardSlot, PlayerInfoWidget, GameLogWidget
 
 
@@ -58,6 +59,8 @@ class GameWidget(QWidget):
         
         self.game_state = game_state
         self.selected_cards = []  # List of CardWidget objects
+        self._card_widgets = []  # Hand card widgets, reused across updates (extra ones hidden)
+        self._turn_style_yours = None  # Turn indicator style currently applied (None = initial)
         
         self._setup_ui()
         
@@ -137,6 +140,7 @@ class GameWidget(QWidget):
         
         self.top_card_widget = EmptyCardSlot("None")
         self.top_card_container.addWidget(self.top_card_widget)
+        self._top_card_view = None  # CardWidget for the top card, created on first use
         cards_layout.addLayout(self.top_card_container)
         
         cards_layout.addStretch()
@@ -210,6 +214,12 @@ class GameWidget(QWidget):
         
         hand_widget = QWidget()
         hand_widget.setLayout(self.hand_layout)
+        
+        # Pre-create (hidden) widgets for a starting hand, so the first
+        # updates only change child properties instead of the layout
+        placeholder = Card.get(constants.EMPTY_PILE_MARKER)
+        for _ in range(constants.INITIAL_HAND_SIZE):
+            self._add_card_widget(placeholder).setVisible(False)
         hand_scroll.setWidget(hand_widget)
         
         hand_container.addWidget(hand_scroll)
@@ -316,17 +326,14 @@ class GameWidget(QWidget):
             self.deck_count_label.setText(str(self.game_state.deck_size))
         # Update top card
         if self.game_state.top_card:
-            # Remove old widget from layout
-            if self.top_card_widget:
-                self.top_card_container.removeWidget(self.top_card_widget)
-                self.top_card_widget.deleteLater()
-            
-            # Create new card widget
-            self.top_card_widget = CardWidget(self.game_state.top_card)
-            self.top_card_widget.set_clickable(False)
-            
-            # Add to layout
-            self.top_card_container.addWidget(self.top_card_widget)
+            if self._top_card_view is None:
+                # First top card - replace the placeholder with a card widget (once)
+                self.top_card_widget.setVisible(False)
+                self._top_card_view = CardWidget(self.game_state.top_card)
+                self._top_card_view.set_clickable(False)
+                self.top_card_container.addWidget(self._top_card_view)
+            else:
+                self._top_card_view.set_card(self.game_state.top_card)
         
         # Update special status
         if self.game_state.must_play_low:
@@ -342,45 +349,66 @@ class GameWidget(QWidget):
         self.reserve_label.setText(f"Reserve: {self.game_state.player.reserves_count}")
         
         # Update turn indicator and buttons
-        if self.game_state.your_turn():
-            self.turn_indicator.setText("🎯 YOUR TURN")
-            self.turn_indicator.setStyleSheet("""
-                font-size: 16px;
-                font-weight: bold;
-                color: #27ae60;
-                background-color: #d5f4e6;
-                padding: 10px;
-                border-radius: 5px;
-            """)
+        # (the stylesheet is only re-applied when the turn actually changes -
+        # setStyleSheet re-polishes the label and invalidates the layout)
+        your_turn = bool(self.game_state.your_turn())
+        if your_turn != self._turn_style_yours:
+            self._turn_style_yours = your_turn
+            if your_turn:
+                self.turn_indicator.setText("🎯 YOUR TURN")
+                self.turn_indicator.setStyleSheet("""
+                    font-size: 16px;
+                    font-weight: bold;
+                    color: #27ae60;
+                    background-color: #d5f4e6;
+                    padding: 10px;
+                    border-radius: 5px;
+                """)
+            else:
+                self.turn_indicator.setText("⏳ Opponent's Turn")
+                self.turn_indicator.setStyleSheet("""
+                    font-size: 16px;
+                    font-weight: bold;
+                    color: #e67e22;
+                    background-color: #ffeaa7;
+                    padding: 10px;
+                    border-radius: 5px;
+                """)
+        
+        if your_turn:
             self._enable_actions()
         else:
-            self.turn_indicator.setText("⏳ Opponent's Turn")
-            self.turn_indicator.setStyleSheet("""
-                font-size: 16px;
-                font-weight: bold;
-                color: #e67e22;
-                background-color: #ffeaa7;
-                padding: 10px;
-                border-radius: 5px;
-            """)
             self._disable_actions()
     
     def _update_hand(self):
         """Update hand display"""
-        # Clear existing cards
-        while self.hand_layout.count() > 1:  # Keep the stretch
-            item = self.hand_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
         # Clear selection
+        for widget in self.selected_cards:
+            widget.set_selected(False)
         self.selected_cards = []
         
-        # Add cards
-        for card in self.game_state.player.hand:
-            card_widget = CardWidget(card)
-            card_widget.clicked.connect(self._on_card_clicked)
-            self.hand_layout.insertWidget(self.hand_layout.count() - 1, card_widget)
+        # Reuse existing card widgets; only create new ones when the hand
+        # is larger than ever before, and hide the unused ones
+        hand = self.game_state.player.hand
+        widgets = self._card_widgets
+        for i, card in enumerate(hand):
+            if i < len(widgets):
+                card_widget = widgets[i]
+                card_widget.set_card(card)
+                card_widget.setVisible(True)
+            else:
+                self._add_card_widget(card)
+        
+        for card_widget in widgets[len(hand):]:
+            card_widget.setVisible(False)
+    
+    def _add_card_widget(self, card: Card) -> CardWidget:
+        """Create a hand card widget and append it to the hand layout and pool"""
+        card_widget = CardWidget(card)
+        card_widget.clicked.connect(self._on_card_clicked)
+        self.hand_layout.insertWidget(self.hand_layout.count() - 1, card_widget)
+        self._card_widgets.append(card_widget)
+        return card_widget
     
     def _enable_actions(self):
         """Enable action buttons based on game state"""
@@ -403,22 +431,22 @@ class GameWidget(QWidget):
         self.reserve_button.setEnabled(False)
     
     def _on_card_clicked(self, card: Card):
-        """Handle card click"""
-        # Find the widget
-        for i in range(self.hand_layout.count() - 1):  # Exclude stretch
-            widget = self.hand_layout.itemAt(i).widget()
-            if isinstance(widget, CardWidget) and widget.get_card() == card:
-                # Toggle selection
-                widget.toggle_selected()
-                
-                if widget.is_selected:
-                    self.selected_cards.append(widget)
-                else:
-                    self.selected_cards.remove(widget)
-                
-                # Update play button
-                self.play_button.setEnabled(len(self.selected_cards) > 0)
-                break
+        """Handle card click (shared slot for every card widget in hand)"""
+        # The emitting widget is the clicked one - no need to search the layout
+        widget = self.sender()
+        if not isinstance(widget, CardWidget):
+            return
+        
+        # Toggle selection
+        widget.toggle_selected()
+        
+        if widget.is_selected:
+            self.selected_cards.append(widget)
+        else:
+            self.selected_cards.remove(widget)
+        
+        # Update play button
+        self.play_button.setEnabled(len(self.selected_cards) > 0)
     
     def _on_play_clicked(self):
         """Handle play button click"""
@@ -478,10 +506,14 @@ class GameWidget(QWidget):
     
     def reset(self):
         """Reset game widget to initial state"""
+        # Pooled card widgets outlive the game - drop their selection too
+        for widget in self.selected_cards:
+            widget.set_selected(False)
         self.selected_cards = []
         self.game_log.clear()
         self.opponent_info.reset()
         self._update_hand()
+        self._turn_style_yours = None
         self.turn_indicator.setText("Waiting for game to start...")
         self.turn_indicator.setStyleSheet("""
             font-size: 16px;
@@ -29,6 +29,16 @@ from .connection_dialog import ConnectionDialog
 from .lobby_widget import LobbyWidget
 from .game_widget import GameWidget
 
+# Message type codes as plain ints - compared per incoming message
+_T_ERROR = int(ServerMessageType.ERROR)
+_T_GAME_STATE = int(ServerMessageType.GAME_STATE)
+_T_TURN_UPDATE = int(ServerMessageType.TURN_UPDATE)
+_T_TURN_RESULT = int(ServerMessageType.TURN_RESULT)
+_T_GAME_OVER = int(ServerMessageType.GAME_OVER)
+_T_ROOM_JOINED = int(ServerMessageType.ROOM_JOINED)
+_T_PLAYER_DISCONNECTED = int(ServerMessageType.PLAYER_DISCONNECTED)
+_T_PLAYER_RECONNECTED = int(ServerMessageType.PLAYER_RECONNECTED)
+
 
 class MainWindow(QMainWindow):
     """
@@ -69,6 +79,13 @@ class MainWindow(QMainWindow):
         # UI state
         self.current_screen = None
         
+        # Coalesces game widget refreshes: several state messages handled in
+        # one event-loop pass (e.g. one network batch) cause a single redraw
+        self._game_refresh_timer = QTimer(self)
+        self._game_refresh_timer.setSingleShot(True)
+        self._game_refresh_timer.setInterval(0)
+        self._game_refresh_timer.timeout.connect(self._refresh_game_widget)
+        
         # Setup
         self._setup_window()
         self._setup_menu_bar()
@@ -251,7 +268,7 @@ class MainWindow(QMainWindow):
             port: Server port
             name: Player name
         """
-        self.logger.info(f"Connection requested: {host}:{port} as '{name}'")
+        self.logger.info("Connection requested: %s:%s as '%s'", host, port, name)
         
         # Initialize game state with player name
         self.game_state.initialize_player(name)
@@ -327,7 +344,7 @@ class MainWindow(QMainWindow):
         Args:
             cards_str: Comma-separated card codes
         """
-        self.logger.info(f"Play cards requested: {cards_str}")
+        self.logger.info("Play cards requested: %s", cards_str)
         self.connection_manager.send_play_cards(cards_str)
     
     def _on_pickup_pile_requested(self):
@@ -344,7 +361,7 @@ class MainWindow(QMainWindow):
     # CONNECTION MANAGER SIGNAL HANDLERS
     # ========================================================================
     
-    def _on_state_changed(self, old_state: str, new_state: str):
+    def _on_state_changed(self, old_state: int, new_state: int):
         """
         Handle connection state change.
         
@@ -352,7 +369,7 @@ class MainWindow(QMainWindow):
             old_state: Previous state
             new_state: New state
         """
-        self.logger.info(f"State changed: {old_state} → {new_state}")
+        self.logger.info("State changed: %s → %s", constants.STATE_NAMES[old_state], constants.STATE_NAMES[new_state])
         
         # Update UI based on state
         if new_state == constants.STATE_CONNECTED:
@@ -395,7 +412,7 @@ class MainWindow(QMainWindow):
         msg_type = message.get('type')
         
         # Handle specific messages
-        if msg_type == ServerMessageType.ERROR:
+        if msg_type == _T_ERROR:
             error_msg = message.get('data', {}).get('error', 'Unknown error')
             self._show_error(f"Server error: {error_msg}")
 
@@ -410,25 +427,23 @@ class MainWindow(QMainWindow):
             if self.game_widget:
                 self.game_widget.add_log_message(f"Error: {error_msg}", "error")
             
-        elif msg_type == ServerMessageType.GAME_STATE:
+        elif msg_type == _T_GAME_STATE:
             # Update game state (full state - used for game start and reconnection)
             self.game_state.update_from_game_state_message(message.get('data', {}))
 
             # Update game widget if visible
             # Note: Screen switching is handled by state change to IN_GAME
-            if self.game_widget and self.current_screen == "game":
-                self.game_widget.update_game_state()
+            self._game_refresh_timer.start()
 
-        elif msg_type == ServerMessageType.TURN_UPDATE:
+        elif msg_type == _T_TURN_UPDATE:
             # Update game state (delta update - used during normal gameplay)
             # TURN_UPDATE has the same structure as GAME_STATE, just fewer fields
             self.game_state.update_from_game_state_message(message.get('data', {}))
 
             # Update game widget if visible
-            if self.game_widget and self.current_screen == "game":
-                self.game_widget.update_game_state()
+            self._game_refresh_timer.start()
 
-        elif msg_type == ServerMessageType.TURN_RESULT:
+        elif msg_type == _T_TURN_RESULT:
             # Log turn result
             result = message.get('data', {}).get('result', '')
             status = message.get('data', {}).get('status', '')
@@ -439,7 +454,7 @@ class MainWindow(QMainWindow):
                 else:
                     self.game_widget.add_log_message(f"Move failed: {result}", "error")
             
-        elif msg_type == ServerMessageType.GAME_OVER:
+        elif msg_type == _T_GAME_OVER:
             winner = message.get('data', {}).get('winner')
             reason = message.get('data', {}).get('reason', '')
             
@@ -448,7 +463,7 @@ class MainWindow(QMainWindow):
             
             self._show_game_over(winner)
         
-        elif msg_type == ServerMessageType.ROOM_JOINED:
+        elif msg_type == _T_ROOM_JOINED:
             # Update lobby with room info
             if self.lobby_widget:
                 data = message.get('data', {})
@@ -463,7 +478,7 @@ class MainWindow(QMainWindow):
                         self.lobby_widget.show_player_joined(joined_player)
                 self.lobby_widget.update_room_info(room_id, player_count, players, room_full)
         
-        elif msg_type == ServerMessageType.PLAYER_DISCONNECTED:
+        elif msg_type == _T_PLAYER_DISCONNECTED:
             disconnected_player = message.get('data', {}).get('disconnected_player')
             if self.game_widget:
                 self.game_widget.add_log_message(f"{disconnected_player} disconnected", "error")
@@ -473,7 +488,7 @@ class MainWindow(QMainWindow):
             if self.lobby_widget and self.current_screen == 'lobby':
                 self.lobby_widget.show_player_disconnected(disconnected_player)
 
-        elif msg_type == ServerMessageType.PLAYER_RECONNECTED:
+        elif msg_type == _T_PLAYER_RECONNECTED:
             reconnected_player = message.get('data', {}).get('reconnected_player')
             if self.game_widget:
                 self.game_widget.add_log_message(f"{reconnected_player} reconnected", "success")
@@ -483,6 +498,11 @@ class MainWindow(QMainWindow):
             if self.lobby_widget and self.current_screen == 'lobby':
                 self.lobby_widget.show_player_reconnected(reconnected_player)
     
+    def _refresh_game_widget(self):
+        """Redraw the game widget from the game state (once per event-loop pass)"""
+        if self.game_widget and self.current_screen == "game":
+            self.game_widget.update_game_state()
+    
     def _on_error(self, error_msg: str):
         """
         Handle error from connection manager.
@@ -490,7 +510,7 @@ class MainWindow(QMainWindow):
         Args:
             error_msg: Error message
         """
-        self.logger.error(f"Connection error: {error_msg}")
+        self.logger.error("Connection error: %s", error_msg)
 
         # Suppress error notifications during auto-reconnection to avoid spam
         # (status bar already shows "Reconnecting... (Xs remaining)")
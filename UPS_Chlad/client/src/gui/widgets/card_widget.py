@@ -4,9 +4,11 @@ Card widget - displays a single playing card.
 A reusable component for showing cards in hand, on the board, etc.
 """
 
+from typing import Dict, Tuple
+
 from PyQt5.QtWidgets import QWidget, QLabel, QVBoxLayout, QFrame
 from PyQt5.QtCore import Qt, pyqtSignal, QSize
-from PyQt5.QtGui import QPainter, QColor, QFont, QPen, QBrush
+from PyQt5.QtGui import QPainter, QColor, QFont, QPen, QBrush, QPixmap
 
 from game import Card
 
@@ -60,6 +62,9 @@ class CardWidget(QFrame):
         '10': '#e74c3c'   # Red (burn pile)
     }
     
+    # Rendered card faces, shared by all widgets: (code, selected, width, height, dpr) -> pixmap
+    _face_cache: Dict[Tuple[str, bool, int, int, float], QPixmap] = {}
+    
     def __init__(self, card: Card, parent=None):
         """
         Initialize card widget.
@@ -97,9 +102,26 @@ class CardWidget(QFrame):
     
     def paintEvent(self, event):
         """Custom paint event to draw the card"""
-        super().paintEvent(event)
+        super().paintEvent(event)  # Frame from the stylesheet (border, hover)
+        
+        # The face only depends on the card and selection - render it once
+        # per combination and blit the cached pixmap afterwards
+        dpr = self.devicePixelRatioF()
+        key = (self.card.code, self.is_selected, self.width(), self.height(), dpr)
+        face = self._face_cache.get(key)
+        if face is None:
+            face = QPixmap(round(self.width() * dpr), round(self.height() * dpr))
+            face.setDevicePixelRatio(dpr)
+            face.fill(Qt.transparent)
+            painter = QPainter(face)
+            self._paint_face(painter)
+            painter.end()
+            self._face_cache[key] = face
         
-        painter = QPainter(self)
+        QPainter(self).drawPixmap(0, 0, face)
+    
+    def _paint_face(self, painter: QPainter):
+        """Draw the card face (everything except the stylesheet frame)"""
         painter.setRenderHint(QPainter.Antialiasing)
         
         # Get colors
@@ -219,6 +241,17 @@ class CardWidget(QFrame):
                 }
             """)
     
+    def set_card(self, card: Card):
+        """
+        Show a different card in this widget.
+        
+        Args:
+            card: Card object to display
+        """
+        if card is not self.card:
+            self.card = card
+            self.update()  # Trigger repaint (face comes from the shared cache)
+    
     def get_card(self) -> Card:
         """Get the card object"""
         return self.card
@@ -238,6 +271,9 @@ class EmptyCardSlot(QWidget):
     Used for showing reserve cards count or empty positions.
     """
     
+    # Rendered labels, shared by all slots: (label, width, height, dpr) -> pixmap
+    _label_cache: Dict[Tuple[str, int, int, float], QPixmap] = {}
+    
     def __init__(self, label: str = "", parent=None):
         """
         Initialize empty card slot.
@@ -264,13 +300,24 @@ class EmptyCardSlot(QWidget):
         super().paintEvent(event)
         
         if self.label:
-            painter = QPainter(self)
-            painter.setRenderHint(QPainter.Antialiasing)
+            dpr = self.devicePixelRatioF()
+            key = (self.label, self.width(), self.height(), dpr)
+            rendered = self._label_cache.get(key)
+            if rendered is None:
+                rendered = QPixmap(round(self.width() * dpr), round(self.height() * dpr))
+                rendered.setDevicePixelRatio(dpr)
+                rendered.fill(Qt.transparent)
+                painter = QPainter(rendered)
+                painter.setRenderHint(QPainter.Antialiasing)
+                
+                painter.setPen(QColor('#7f8c8d'))
+                font = QFont("Arial", 10)
+                painter.setFont(font)
+                painter.drawText(self.rect(), Qt.AlignCenter, self.label)
+                painter.end()
+                self._label_cache[key] = rendered
             
-            painter.setPen(QColor('#7f8c8d'))
-            font = QFont("Arial", 10)
-            painter.setFont(font)
-            painter.drawText(self.rect(), Qt.AlignCenter, self.label)
+            QPainter(self).drawPixmap(0, 0, rendered)
     
     def set_label(self, label: str):
         """Update label text"""
@@ -2,11 +2,73 @@
 Game log widget - displays game events and messages.
 """
 
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QTextEdit, QLabel
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QFont, QTextCursor
+from collections import deque
+
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QListView, QLabel
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex
+from PyQt5.QtGui import QFont, QBrush, QColor
 from datetime import datetime
 
+from utils import constants
+
+# Message type -> text color (types not listed use the default color)
+_TYPE_COLORS = {
+    "system": "#7f8c8d",     # Gray
+    "error": "#e74c3c",      # Red
+    "success": "#27ae60",    # Green
+    "highlight": "#3498db",  # Blue
+}
+_BOLD_TYPES = frozenset({"error", "success", "highlight"})
+
+
+class _GameLogModel(QAbstractListModel):
+    """
+    List model holding the most recent log lines.
+    
+    Rows live in a bounded deque, so memory stays flat however long the
+    game runs; brushes and the bold font are built once and shared.
+    """
+    
+    def __init__(self, max_entries: int, font: QFont, parent=None):
+        super().__init__(parent)
+        self._rows = deque(maxlen=max_entries)  # (text, message_type)
+        self._brushes = {kind: QBrush(QColor(color)) for kind, color in _TYPE_COLORS.items()}
+        self._bold_font = QFont(font)
+        self._bold_font.setBold(True)
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        text, message_type = self._rows[index.row()]
+        if role == Qt.DisplayRole or role == Qt.ToolTipRole:
+            return text
+        if role == Qt.ForegroundRole:
+            return self._brushes.get(message_type)
+        if role == Qt.FontRole and message_type in _BOLD_TYPES:
+            return self._bold_font
+        return None
+    
+    def append(self, text: str, message_type: str):
+        """Append a row, dropping the oldest one when full"""
+        rows = self._rows
+        if len(rows) == rows.maxlen:
+            self.beginRemoveRows(QModelIndex(), 0, 0)
+            rows.popleft()
+            self.endRemoveRows()
+        row = len(rows)
+        self.beginInsertRows(QModelIndex(), row, row)
+        rows.append((text, message_type))
+        self.endInsertRows()
+    
+    def clear(self):
+        """Remove all rows"""
+        self.beginResetModel()
+        self._rows.clear()
+        self.endResetModel()
+
 
 class GameLogWidget(QWidget):
     """
@@ -49,24 +111,32 @@ class GameLogWidget(QWidget):
         title.setStyleSheet("font-weight: bold; font-size: 12px; color: #2c3e50;")
         layout.addWidget(title)
         
-        # Text area
-        self.text_edit = QTextEdit()
-        self.text_edit.setReadOnly(True)
-        self.text_edit.setStyleSheet("""
-            QTextEdit {
+        # Log list (model/view - only visible rows are painted)
+        font = QFont("Courier New")
+        font.setStyleHint(QFont.Monospace)
+        font.setPixelSize(10)
+        self.model = _GameLogModel(constants.GAME_LOG_MAX_ENTRIES, font, self)
+        self.list_view = QListView()
+        self.list_view.setFont(font)
+        self.list_view.setModel(self.model)
+        # Wrap long entries like the old text log (rows are capped, so per-row sizing stays cheap)
+        self.list_view.setWordWrap(True)
+        self.list_view.setResizeMode(QListView.Adjust)  # Re-wrap when the width changes
+        self.list_view.setSelectionMode(QListView.NoSelection)
+        self.list_view.setFocusPolicy(Qt.NoFocus)
+        self.list_view.setStyleSheet("""
+            QListView {
                 background-color: #ffffff;
                 border: 2px solid #bdc3c7;
                 border-radius: 5px;
                 padding: 5px;
-                font-family: 'Courier New', monospace;
-                font-size: 10px;
             }
         """)
         
         # Set maximum height
-        self.text_edit.setMaximumHeight(200)
+        self.list_view.setMaximumHeight(200)
         
-        layout.addWidget(self.text_edit)
+        layout.addWidget(self.list_view)
         
         self.setLayout(layout)
         self.setFixedWidth(250)
@@ -82,27 +152,11 @@ class GameLogWidget(QWidget):
         # Get timestamp
         timestamp = datetime.now().strftime("%H:%M:%S")
         
-        # Format based on type
-        if message_type == "system":
-            color = "#7f8c8d"  # Gray
-            formatted = f"<span style='color: {color};'>[{timestamp}] {message}</span>"
-        elif message_type == "error":
-            color = "#e74c3c"  # Red
-            formatted = f"<span style='color: {color}; font-weight: bold;'>[{timestamp}] {message}</span>"
-        elif message_type == "success":
-            color = "#27ae60"  # Green
-            formatted = f"<span style='color: {color}; font-weight: bold;'>[{timestamp}] {message}</span>"
-        elif message_type == "highlight":
-            color = "#3498db"  # Blue
-            formatted = f"<span style='color: {color}; font-weight: bold;'>[{timestamp}] {message}</span>"
-        else:
-            formatted = f"[{timestamp}] {message}"
-        
-        # Append to text edit
-        self.text_edit.append(formatted)
+        # Append to the model (colors/bold come from the message type)
+        self.model.append(f"[{timestamp}] {message}", message_type)
         
         # Auto-scroll to bottom
-        self.text_edit.moveCursor(QTextCursor.End)
+        self.list_view.scrollToBottom()
     
     def add_game_event(self, event: str):
         """
@@ -152,7 +206,7 @@ class GameLogWidget(QWidget):
     
     def clear(self):
         """Clear all messages"""
-        self.text_edit.clear()
+        self.model.clear()
     
     def reset(self):
         """Reset log (alias for clear)"""
@@ -8,7 +8,7 @@ from .message_types import ClientMessageType, ServerMessageType
 from .message_buffer import MessageBuffer
 from .protocol_message import ProtocolMessage
 from .message_protocol import MessageProtocol
-from .validator import MessageValidator, ValidationError
+from .validator import MessageValidator
 
 __all__ = [
     'ClientMessageType',
@@ -17,5 +17,4 @@ __all__ = [
     'ProtocolMessage',
     'MessageProtocol',
     'MessageValidator',
-    'ValidationError',
 ]
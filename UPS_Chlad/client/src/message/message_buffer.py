@@ -1,53 +1,71 @@
+from typing import Sequence
+
+# Returned when no message is complete yet (the common partial-recv case) -
+# immutable, so it can be shared instead of allocating an empty list per call
+_NO_MESSAGES: Sequence[str] = ()
+
+
 class MessageBuffer:
     """
     Accumulates TCP data and extracts complete messages.
     Messages are delimited by newline (\n).
+    
+    Data is kept as raw bytes; only complete lines are decoded, so a
+    multi-byte UTF-8 character split across two recvs is never cut.
     """
     
     MAX_BUFFER_SIZE = 1024 * 1024  # 1MB - protect against memory issues
     
     def __init__(self, max_size: int = None):
-        self._buffer = ""
+        self._buffer = bytearray()
+        self._scan_pos = 0  # Bytes before this offset are known to hold no \n
         self.max_size = max_size or self.MAX_BUFFER_SIZE
     
-    def add_data(self, data: str) -> list[str]:
+    def add_data(self, data: bytes) -> Sequence[str]:
         """
         Add received data to buffer and return list of complete messages.
         
         Args:
-            data: Raw string data from socket
+            data: Raw bytes from socket (bytes, bytearray or memoryview)
             
         Returns:
-            List of complete messages (without \n)
+            Complete messages (decoded, without \n); an empty tuple if none
             
         Example:
-            buffer.add_data("100|Alice||name=")  # Returns []
-            buffer.add_data("Alice\n101|Bob")    # Returns ["100|Alice||name=Alice"]
-            buffer.add_data("||name=Bob\n")      # Returns ["101|Bob||name=Bob"]
+            buffer.add_data(b"100|Alice||name=")  # Returns ()
+            buffer.add_data(b"Alice\n101|Bob")    # Returns ["100|Alice||name=Alice"]
+            buffer.add_data(b"||name=Bob\n")      # Returns ["101|Bob||name=Bob"]
         """
-        self._buffer += data
+        buffer = self._buffer
+        buffer += data
         
         # Check buffer size limit
-        if len(self._buffer) > self.max_size:
-            raise ValueError(f"Buffer overflow: size {len(self._buffer)} exceeds max {self.max_size}")
+        if len(buffer) > self.max_size:
+            raise ValueError(f"Buffer overflow: size {len(buffer)} exceeds max {self.max_size}")
         
-        messages = []
+        # Only the last newline matters: everything before it is complete
+        # messages, carved out with one decode and one C-level split.
+        # The search resumes where the previous call stopped instead of
+        # rescanning a partial line.
+        newline = buffer.rfind(b'\n', self._scan_pos)
+        if newline < 0:
+            self._scan_pos = len(buffer)
+            return _NO_MESSAGES
         
-        # Extract all complete messages (ending with \n)
-        while '\n' in self._buffer:
-            idx = self._buffer.index('\n')
-            message = self._buffer[:idx]
-            self._buffer = self._buffer[idx + 1:]
-            
-            if message:  # Ignore empty lines
-                messages.append(message)
+        messages = [message for message in buffer[:newline].decode('utf-8').split('\n')
+                    if message]  # Ignore empty lines
+        
+        # Drop consumed bytes once per call
+        del buffer[:newline + 1]
+        self._scan_pos = len(buffer)
         
         return messages
     
     def clear(self):
         """Clear buffer (e.g., after disconnect)"""
-        self._buffer = ""
+        self._buffer.clear()
+        self._scan_pos = 0
     
     def has_data(self) -> bool:
         """Check if buffer has incomplete data"""
-        return len(self._buffer) > 0
\ No newline at end of file
+        return len(self._buffer) > 0
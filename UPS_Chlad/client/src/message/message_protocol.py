@@ -1,5 +1,17 @@
+from functools import lru_cache
+from typing import Dict, Tuple
+
+from .message_types import ClientMessageType, ServerMessageType
 from .protocol_message import ProtocolMessage
 
+# Argumentless client messages (no player, room or data fields), filled in
+# once below the class: message type -> message string / encoded frame
+_FIXED_MESSAGES: Dict[int, str] = {}
+_FIXED_FRAMES: Dict[int, bytes] = {}
+
+# Wire type field -> int type code for known server messages (skips int() parsing)
+_SERVER_TYPE_CODES: Dict[str, int] = {str(t.value): t.value for t in ServerMessageType}
+
 
 class MessageProtocol:
     """
@@ -83,38 +95,81 @@ class MessageProtocol:
         Raises:
             ValueError: If message format is invalid
         """
-        parts = message.split('|')
+        # Header fields split off once; the data fields stay in one string
+        parts = message.split('|', 3)
         
         if len(parts) < 3:
             raise ValueError(f"Invalid message format: {message}")
         
-        try:
-            msg_type = int(parts[0])
-        except ValueError:
-            raise ValueError(f"Invalid message type: {parts[0]}")
+        msg_type = _SERVER_TYPE_CODES.get(parts[0])
+        if msg_type is None:
+            try:
+                msg_type = int(parts[0])
+            except ValueError:
+                raise ValueError(f"Invalid message type: {parts[0]}")
         
         player_id = parts[1]
         room_id = parts[2]
+        if len(parts) < 4 or not parts[3]:
+            return ProtocolMessage(msg_type, player_id, room_id, {})
         
         # Parse key=value pairs (may be compact codes or full names)
+        # Bind the reverse-map lookup once - this loop runs for every field of every message
+        full_name = MessageProtocol.REVERSE_FIELD_CODE_MAP.get
         data = {}
-        for i in range(3, len(parts)):
-            if '=' in parts[i]:
-                key, value = parts[i].split('=', 1)  # Split only on first =
-                # Convert compact code to full field name (or keep as-is if already full)
-                full_field_name = MessageProtocol.get_full_field_name(key)
+        for part in parts[3].split('|'):
+            key, sep, value = part.partition('=')  # Split only on first =
+            if not sep:
+                continue
+
+            # Convert compact code to full field name (or keep as-is if already full)
+            full_field_name = full_name(key, key)
 
-                # ALSO convert compact value to full value (e.g., "temp" → "temporarily_disconnected")
-                # BUT: Only if value is NOT a pure number (to avoid converting "1", "2", etc.)
-                full_value = value
-                if value and not value.lstrip('-').isdigit():
-                    # Only convert if NOT numeric
-                    full_value = MessageProtocol.get_full_field_name(value)
+            # ALSO convert compact value to full value (e.g., "temp" → "temporarily_disconnected")
+            # BUT: Only if value is NOT a pure number (to avoid converting "1", "2", etc.)
+            full_value = value
+            if value and not value.lstrip('-').isdigit():
+                # Only convert if NOT numeric
+                full_value = full_name(value, value)
 
-                data[full_field_name] = full_value
+            data[full_field_name] = full_value
 
         return ProtocolMessage(msg_type, player_id, room_id, data)
     
+    @staticmethod
+    def fixed_frame(msg_type: int) -> bytes:
+        """
+        Get the prebuilt encoded frame of an argumentless client message.
+        
+        Args:
+            msg_type: Client message type code (e.g., ClientMessageType.PING)
+            
+        Returns:
+            UTF-8 encoded message WITH \n terminator, ready for the socket
+            
+        Raises:
+            KeyError: If msg_type is not a client message type
+        """
+        return _FIXED_FRAMES[msg_type]
+
+    @staticmethod
+    def build_frame(msg_type: int, player_id: str = "", room_id: str = "", **data) -> bytes:
+        """
+        Build an encoded message frame, ready for the socket.
+        
+        Same arguments and wire format as build(); recently built frames
+        are cached, so repeated messages skip formatting and encoding.
+        
+        Returns:
+            UTF-8 encoded message WITH \n terminator
+            
+        Example:
+            build_frame(0, name="Alice")
+            → b"0|||nm=Alice\n"
+        """
+        items = tuple([(key, str(value)) for key, value in data.items()])
+        return _build_frame_cached(int(msg_type), player_id, room_id, items)
+
     @staticmethod
     def build(msg_type: int, player_id: str = "", room_id: str = "", **data) -> str:
         """
@@ -133,6 +188,11 @@ class MessageProtocol:
             build(0, player_id="", room_id="", name="Alice")
             → "0|||name=Alice\n"
         """
+        if not (player_id or room_id or data):
+            fixed = _FIXED_MESSAGES.get(msg_type)
+            if fixed is not None:
+                return fixed
+
         message = f"{msg_type}|{player_id}|{room_id}|"
 
         # Add data fields (convert to compact codes for efficient transmission)
@@ -148,4 +208,17 @@ class MessageProtocol:
         # CRITICAL: Add newline terminator
         message += "\n"
 
-        return message
\ No newline at end of file
+        return message
+
+
+for _msg_type in ClientMessageType:
+    _FIXED_MESSAGES[_msg_type] = MessageProtocol.build(_msg_type)
+    _FIXED_FRAMES[_msg_type] = _FIXED_MESSAGES[_msg_type].encode('utf-8')
+del _msg_type
+
+
+@lru_cache(maxsize=64)
+def _build_frame_cached(msg_type: int, player_id: str, room_id: str,
+                        items: Tuple[Tuple[str, str], ...]) -> bytes:
+    """Cached body of MessageProtocol.build_frame (data fields in call order)"""
+    return MessageProtocol.build(msg_type, player_id, room_id, **dict(items)).encode('utf-8')
@@ -3,6 +3,8 @@ class ProtocolMessage:
     Represents a parsed protocol message.
     """
     
+    __slots__ = ('type', 'player_id', 'room_id', 'data')
+    
     def __init__(self, msg_type: int, player_id: str = "", room_id: str = "", data: dict = None):
         self.type = msg_type
         self.player_id = player_id
@@ -1,15 +1,21 @@
-from typing import Tuple
-from enum import Enum
+from typing import Tuple, Dict, FrozenSet
 
 from .protocol_message import ProtocolMessage
 from .message_types import ClientMessageType, ServerMessageType
 
-class ValidationError(Enum):
-    """Types of validation errors"""
-    INVALID_FORMAT = "invalid_format"
-    INVALID_STATE = "invalid_state"
-    INVALID_GAME_RULE = "invalid_game_rule"
-    INVALID_DATA = "invalid_data"
+# Precomputed lookup tables (avoid IntEnum construction per message)
+_VALID_SERVER_TYPES = frozenset(m.value for m in ServerMessageType)
+
+# Plain int type codes for hot-path comparisons (skips IntEnum attribute lookup)
+_PLAY_CARDS = int(ClientMessageType.PLAY_CARDS)
+
+# Fields that must be present per server message type (types not listed have none)
+_REQUIRED_FIELDS: Dict[int, FrozenSet[str]] = {
+    ServerMessageType.CONNECTED: frozenset({'name', 'status'}),
+    ServerMessageType.GAME_STATE: frozenset({'hand', 'top_card'}),
+    ServerMessageType.TURN_UPDATE: frozenset({'hand', 'top_card'}),
+    ServerMessageType.GAME_OVER: frozenset({'winner'}),
+}
 
 
 class MessageValidator:
@@ -21,6 +27,7 @@ class MessageValidator:
     def __init__(self, threshold: int = 3):
         self.invalid_count = 0
         self.threshold = threshold
+        self._threshold_note = f" (threshold {threshold} reached)"  # Formatted once
     
     def validate_incoming(self, message: ProtocolMessage, current_state: str) -> Tuple[bool, str]:
         """
@@ -62,7 +69,7 @@ class MessageValidator:
             (is_valid, error_reason)
         """
         # Example: Can't play cards if not your turn
-        if message.type == ClientMessageType.PLAY_CARDS:
+        if message.type == _PLAY_CARDS:
             if not game_state.your_turn:
                 return False, "Not your turn"
             
@@ -70,8 +77,9 @@ class MessageValidator:
             cards_str = message.data.get('cards', '')
             if cards_str != 'RESERVE':
                 cards = cards_str.split(',')
+                hand_codes = {c.code for c in game_state.hand}
                 for card in cards:
-                    if card not in [c.code for c in game_state.hand]:
+                    if card not in hand_codes:
                         return False, f"Card {card} not in hand"
         
         return True, ""
@@ -79,12 +87,10 @@ class MessageValidator:
     def _record_invalid(self, reason: str) -> Tuple[bool, str]:
         """Record an invalid message and check threshold"""
         self.invalid_count += 1
-        should_disconnect = self.invalid_count >= self.threshold
-        
-        if should_disconnect:
-            reason += f" (threshold {self.threshold} reached)"
+        if self.invalid_count < self.threshold:
+            return False, reason
         
-        return False, reason
+        return False, reason + self._threshold_note
     
     def reset(self):
         """Reset invalid count (e.g., after successful reconnect)"""
@@ -92,11 +98,7 @@ class MessageValidator:
     
     def _is_valid_server_message_type(self, msg_type: int) -> bool:
         """Check if message type is a valid server message"""
-        try:
-            ServerMessageType(msg_type)
-            return True
-        except ValueError:
-            return False
+        return msg_type in _VALID_SERVER_TYPES
     
     def _is_valid_for_state(self, msg_type: int, current_state: str) -> bool:
         """
@@ -116,10 +118,5 @@ class MessageValidator:
     
     def _has_required_fields(self, message: ProtocolMessage) -> bool:
         """Check if message has required fields based on type"""
-        # TODO: Implement required field checking per message type
-        
-        # Example:
-        # - CONNECTED requires 'name' and 'status'
-        # - GAME_STATE requires 'hand', 'top_card', etc.
-        
-        return True  # For now, accept everything
\ No newline at end of file
+        required = _REQUIRED_FIELDS.get(message.type)
+        return required is None or required.issubset(message.data.keys())
@@ -5,11 +5,13 @@ CRITICAL: This runs in a separate QThread to avoid blocking the GUI.
 All communication with the main thread is via Qt signals (thread-safe).
 """
 
+import logging
+import selectors
 import socket
-from typing import Optional
+from typing import List, Optional, Sequence
 from PyQt5.QtCore import QThread, pyqtSignal
 
-from message import MessageBuffer, MessageProtocol
+from message import MessageBuffer, MessageProtocol, ServerMessageType
 from utils import (
     get_logger,
     log_message_sent,
@@ -19,6 +21,13 @@ from utils import (
     constants
 )
 
+# Exact wire form of the server's PONG (no player, room or data fields)
+_PONG_RAW = f"{int(ServerMessageType.PONG)}||"
+_PONG_TYPE = int(ServerMessageType.PONG)
+
+# Selector key data marking the wakeup socket (the server socket has None)
+_WAKEUP = object()
+
 
 class NetworkClient(QThread):
     """
@@ -27,20 +36,20 @@ class NetworkClient(QThread):
     Responsibilities:
     - Establish/close TCP connection
     - Send messages to server
-    - Receive messages from server (blocking recv in thread)
+    - Receive messages from server (selector wait + recv in thread)
     - Parse incoming messages
     - Emit signals for all events
     
     Signals:
     - connected: Emitted when TCP connection established
     - disconnected: Emitted when connection lost
-    - message_received: Emitted when valid message parsed
+    - messages_received_batch: Emitted once per recv with all messages parsed from it
     - error_occurred: Emitted on any error
     - connection_timeout: Emitted when no data received for timeout period
     
     Usage:
         client = NetworkClient("127.0.0.1", 8080)
-        client.message_received.connect(on_message)
+        client.messages_received_batch.connect(on_messages)
         client.connected.connect(on_connected)
         client.start()  # Start thread
         client.connect_to_server()
@@ -49,7 +58,7 @@ class NetworkClient(QThread):
     # Signals (thread-safe communication)
     connected = pyqtSignal()  # TCP connection established
     disconnected = pyqtSignal()  # Connection lost
-    message_received = pyqtSignal(dict)  # Parsed message (as dict)
+    messages_received_batch = pyqtSignal(list)  # Parsed messages (list of dicts) from one recv
     error_occurred = pyqtSignal(str)  # Error message
     connection_timeout = pyqtSignal()  # No data received within timeout
     
@@ -72,8 +81,23 @@ class NetworkClient(QThread):
         # Message buffer for handling partial TCP messages
         self.buffer = MessageBuffer()
         
+        # Reusable receive buffer (recv_into avoids a new bytes object per recv)
+        self._recv_buf = bytearray(constants.SOCKET_RECV_BUFFER_SIZE)
+        self._recv_view = memoryview(self._recv_buf)
+        
+        # Readiness selector - idle ticks return an empty list instead of raising socket.timeout
+        self._selector = selectors.DefaultSelector()
+        
+        # Self-pipe: a byte written here wakes the receive loop out of select()
+        # on connect and stop, so it never has to poll
+        self._wakeup_recv, self._wakeup_send = socket.socketpair()
+        self._wakeup_recv.setblocking(False)
+        self._wakeup_send.setblocking(False)
+        self._selector.register(self._wakeup_recv, selectors.EVENT_READ, _WAKEUP)
+        self._close_on_exit = False  # Set by stop() when the thread outlives its wait - run() closes the selector
+        
         self.logger = get_logger()
-        self.logger.info(f"NetworkClient initialized for {host}:{port}")
+        self.logger.info("NetworkClient initialized for %s:%s", host, port)
     
     def set_server(self, host: str, port: int):
         """
@@ -89,7 +113,7 @@ class NetworkClient(QThread):
         
         self.host = host
         self.port = port
-        self.logger.info(f"Server updated to {host}:{port}")
+        self.logger.info("Server updated to %s:%s", host, port)
     
     def connect_to_server(self) -> bool:
         """
@@ -103,18 +127,23 @@ class NetworkClient(QThread):
             self.logger.warning("Already connected")
             return False
         
-        self.logger.info(f"Initiating connection to {self.host}:{self.port}")
+        self.logger.info("Initiating connection to %s:%s", self.host, self.port)
         
         try:
             # Create socket
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.socket.settimeout(constants.SOCKET_TIMEOUT)
+            self._tune_socket()
             
             # Connect
             self.socket.connect((self.host, self.port))
             
+            # Watch for incoming data
+            self._selector.register(self.socket, selectors.EVENT_READ)
+            
             # Mark as connected
             self.connected_flag = True
+            self._wake()
             
             log_connection_event("CONNECTED", f"{self.host}:{self.port}")
             self.connected.emit()
@@ -149,6 +178,7 @@ class NetworkClient(QThread):
         self.logger.info("Disconnecting from server")
         self.running = False
         self.connected_flag = False
+        self._wake()
         self._cleanup_socket()
 
         # Clear message buffer to discard any partial messages
@@ -189,6 +219,53 @@ class NetworkClient(QThread):
             log_error(error_msg, e)
             self.error_occurred.emit(error_msg)
     
+    def send_many(self, messages: List[str]):
+        """
+        Send several messages to server with a single sendall.
+        
+        Messages are joined, encoded once and written in one syscall instead
+        of one send per message.
+        
+        Args:
+            messages: Protocol message strings (trailing \\n optional)
+        """
+        if not messages:
+            return
+        
+        lines = [message.rstrip('\n') for message in messages]
+        self.send_raw(('\n'.join(lines) + '\n').encode('utf-8'))
+    
+    def send_raw(self, payload: bytes):
+        """
+        Send pre-encoded protocol data to server with a single sendall.
+        
+        Args:
+            payload: One or more encoded messages, each terminated by \\n
+        """
+        if not payload:
+            return
+        
+        if not self.connected_flag or not self.socket:
+            self.logger.warning("Cannot send - not connected")
+            return
+        
+        try:
+            self.socket.sendall(payload)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                for line in payload.decode('utf-8').splitlines():
+                    log_message_sent(line)
+            
+        except socket.error as e:
+            error_msg = f"Send error: {e}"
+            log_error(error_msg, e)
+            self.error_occurred.emit(error_msg)
+            self._handle_connection_lost()
+            
+        except Exception as e:
+            error_msg = f"Unexpected send error: {e}"
+            log_error(error_msg, e)
+            self.error_occurred.emit(error_msg)
+    
     def run(self):
         """
         Main thread loop - continuously receives data from server.
@@ -197,64 +274,154 @@ class NetworkClient(QThread):
         self.running = True  # Thread is now running
         self.logger.info("NetworkClient thread started")
         
-        while self.running:
-            if not self.connected_flag or not self.socket:
-                # Not connected, sleep briefly
-                self.msleep(100)
-                continue
-            
-            try:
-                # Receive data (blocking with timeout)
-                data = self.socket.recv(constants.SOCKET_RECV_BUFFER_SIZE)
-                
-                if not data:
-                    # Server closed connection
-                    self.logger.info("Server closed connection (recv returned empty)")
-                    self._handle_connection_lost()
+        # Bind hot attributes to locals once (buffer and signal objects live as long as the thread).
+        # The socket is re-read every iteration because it is replaced on reconnect.
+        recv_view = self._recv_view
+        process = self._process_message
+        emit_batch = self.messages_received_batch.emit
+        debug_enabled = self.logger.isEnabledFor
+        select = self._selector.select
+        select_timeout = constants.SOCKET_TIMEOUT
+        batch_max = constants.MESSAGE_BATCH_MAX
+        drain_wakeup = self._drain_wakeup
+        
+        try:
+            while self.running:
+                sock = self.socket
+                if not self.connected_flag or not sock:
+                    # Not connected - block until connect/stop wakes us (no polling)
+                    select(select_timeout)
+                    drain_wakeup()
                     continue
                 
-                # Decode and add to buffer
-                decoded = data.decode('utf-8')
-                complete_messages = self.buffer.add_data(decoded)
-                
-                # Process each complete message
-                for raw_message in complete_messages:
-                    log_message_received(raw_message)
-                    self._process_message(raw_message)
-                
-            except socket.timeout:
-                # Timeout is normal - just means no data received
-                continue
-                
-            except socket.error as e:
-                if self.running:  # Only log if we didn't initiate disconnect
-                    error_msg = f"Socket error: {e}"
-                    log_error(error_msg, e)
-                    self._handle_connection_lost()
-                break
-                
-            except Exception as e:
-                if self.running:
-                    error_msg = f"Receive error: {e}"
-                    log_error(error_msg, e)
-                    self.error_occurred.emit(error_msg)
-                break
+                try:
+                    # Wait for data (no events within timeout is normal - just means no data received)
+                    readable = False
+                    for key, _ in select(select_timeout):
+                        if key.data is _WAKEUP:
+                            drain_wakeup()
+                        else:
+                            readable = True
+                    if not readable:
+                        continue
+                    
+                    received = sock.recv_into(recv_view)
+                    
+                    if not received:
+                        # Server closed connection
+                        self.logger.info("Server closed connection (recv returned empty)")
+                        self._handle_connection_lost()
+                        continue
+                    
+                    # Buffer the data, drain whatever else the kernel already has queued
+                    # and collect the complete messages
+                    complete_messages, eof = self._drain_socket(sock, received)
+                    
+                    # Process each complete message
+                    # (check the level once per batch - skips per-message log formatting when DEBUG is off)
+                    log_received = debug_enabled(logging.DEBUG)
+                    batch = []
+                    for raw_message in complete_messages:
+                        if log_received:
+                            log_message_received(raw_message)
+                        message_dict = process(raw_message)
+                        if message_dict is not None:
+                            batch.append(message_dict)
+                            if len(batch) >= batch_max:
+                                # Hand a full batch to the GUI thread so a flood can't build one huge list
+                                emit_batch(batch)
+                                batch = []
+                    
+                    # One cross-thread signal per batch instead of one per message
+                    if batch:
+                        emit_batch(batch)
+                    
+                    if eof:
+                        # Server closed connection while draining
+                        self.logger.info("Server closed connection (recv returned empty)")
+                        self._handle_connection_lost()
+                    
+                except socket.timeout:
+                    # Readable socket that still timed out - treat like an idle tick
+                    continue
+                    
+                except socket.error as e:
+                    if self.running:  # Only log if we didn't initiate disconnect
+                        error_msg = f"Socket error: {e}"
+                        log_error(error_msg, e)
+                        self._handle_connection_lost()
+                    break
+                    
+                except Exception as e:
+                    if self.running:
+                        error_msg = f"Receive error: {e}"
+                        log_error(error_msg, e)
+                        self.error_occurred.emit(error_msg)
+                    break
+        finally:
+            if self._close_on_exit:
+                # stop() gave up waiting - nothing uses the selector/wakeup pair any more
+                self._close_selector()
         
         self.logger.info("NetworkClient thread stopped")
     
-    def _process_message(self, raw_message: str):
+    def _drain_socket(self, sock: socket.socket, received: int) -> tuple[Sequence[str], bool]:
+        """
+        Add received data to the message buffer and read any further data
+        already queued on the socket without blocking (socket mode is left untouched).
+        
+        Args:
+            sock: Connected socket (blocking with timeout)
+            received: Bytes placed in the receive buffer by the preceding recv_into
+            
+        Returns:
+            (complete messages, True if the server closed the connection)
+        """
+        view = self._recv_view
+        add_data = self.buffer.add_data
+        messages = add_data(view[:received])
+        eof = False
+        
+        # Poll readiness instead of toggling the socket to non-blocking - the GUI
+        # thread may be in sendall() on the same socket and relies on its timeout
+        select = self._selector.select
+        for _ in range(constants.SOCKET_DRAIN_MAX_READS):
+            if not any(key.fileobj is sock for key, _ in select(0)):
+                break  # Nothing more queued
+            received = sock.recv_into(view)
+            if not received:
+                eof = True
+                break
+            more = add_data(view[:received])
+            if more:
+                if messages:
+                    messages.extend(more)
+                else:
+                    messages = more
+        
+        return messages, eof
+    
+    def _process_message(self, raw_message: str) -> Optional[dict]:
         """
-        Parse and emit message.
+        Parse message into a dict for the batch signal.
         
         Args:
             raw_message: Raw protocol message string
+            
+        Returns:
+            Message dict, or None if the message could not be parsed
         """
+        # Fast path: PONG is the most frequent message and carries no payload
+        if raw_message == _PONG_RAW:
+            return {'type': _PONG_TYPE, 'player': '', 'room': '', 'data': {}, 'raw': raw_message}
+        
         try:
             # Parse message
             parsed = MessageProtocol.parse(raw_message)
             
-            # Convert to dict for signal
-            message_dict = {
+            # Single dict built in place
+            # (references parsed.data directly - no copy, no to_dict())
+            return {
                 'type': parsed.type,
                 'player': parsed.player_id,  # Fixed: use player_id not player
                 'room': parsed.room_id,      # Fixed: use room_id not room
@@ -262,26 +429,63 @@ class NetworkClient(QThread):
                 'raw': raw_message
             }
             
-            # Emit signal
-            self.message_received.emit(message_dict)
-            
         except ValueError as e:
             error_msg = f"Invalid message format: {e}"
             log_error(error_msg)
             self.error_occurred.emit(error_msg)
+            return None
     
     def _handle_connection_lost(self):
         """Handle unexpected connection loss"""
         if self.connected_flag:
             self.connected_flag = False
             self.running = False
+            self._wake()
             log_connection_event("CONNECTION_LOST")
             self._cleanup_socket()
             self.disconnected.emit()
     
+    def _tune_socket(self):
+        """
+        Tune socket for small, latency-sensitive protocol messages.
+        
+        Disables Nagle's algorithm (no coalescing delay on small sends) and
+        enlarges kernel buffers so bursts need fewer recv calls.
+        Options are best-effort - unsupported ones are skipped.
+        """
+        options = (
+            (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+            (socket.SOL_SOCKET, socket.SO_RCVBUF, constants.SOCKET_KERNEL_RCVBUF),
+            (socket.SOL_SOCKET, socket.SO_SNDBUF, constants.SOCKET_KERNEL_SNDBUF),
+        )
+        for level, option, value in options:
+            try:
+                self.socket.setsockopt(level, option, value)
+            except OSError as e:
+                self.logger.debug("Socket option %s not applied: %s", option, e)
+    
+    def _wake(self):
+        """Wake the receive loop if it is blocked in select() (any thread)"""
+        try:
+            self._wakeup_send.send(b'\0')
+        except OSError:
+            pass  # Pipe full (a wakeup is already pending) or closed
+    
+    def _drain_wakeup(self):
+        """Consume pending wakeup bytes (receive thread)"""
+        try:
+            while self._wakeup_recv.recv(64):
+                pass
+        except OSError:
+            pass  # Drained (BlockingIOError) or closed
+    
     def _cleanup_socket(self):
         """Clean up socket resources"""
         if self.socket:
+            try:
+                self._selector.unregister(self.socket)
+            except (KeyError, ValueError):
+                pass  # Never registered (connect failed) or already closed
             try:
                 self.socket.close()
             except Exception:
@@ -295,7 +499,21 @@ class NetworkClient(QThread):
         self.disconnect_from_server()
         
         # Wait for thread to finish (max 2 seconds)
-        self.wait(2000)
+        if self.wait(2000):
+            self._close_selector()
+            return
+        
+        # Still inside select()/drain - closing the selector under it would break the loop
+        self.logger.warning("NetworkClient thread did not stop within 2s - it closes its selector on exit")
+        self._close_on_exit = True
+        if self.isFinished():
+            self._close_selector()  # Finished before it saw the flag (closing twice is harmless)
+    
+    def _close_selector(self):
+        """Close the selector and both ends of the wakeup pair"""
+        self._selector.close()
+        self._wakeup_recv.close()
+        self._wakeup_send.close()
     
     def is_connected(self) -> bool:
         """Check if currently connected"""
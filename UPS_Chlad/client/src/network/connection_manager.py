@@ -3,9 +3,10 @@ Connection manager - orchestrates network client and heartbeat.
 Handles state machine and reconnection logic.
 """
 
-from typing import Optional, Callable
+import random
+import time
+from typing import Optional, Callable, List, Union
 from PyQt5.QtCore import QObject, pyqtSignal, QTimer
-from datetime import datetime, timedelta
 
 from .client import NetworkClient
 from .heartbeat_manager import HeartbeatManager
@@ -19,6 +20,17 @@ from utils import (
     constants
 )
 
+# Fixed protocol messages (no dynamic fields) - prebuilt, already encoded frames
+_MSG_JOIN_ROOM = MessageProtocol.fixed_frame(ClientMessageType.JOIN_ROOM)
+_MSG_START_GAME = MessageProtocol.fixed_frame(ClientMessageType.START_GAME)
+_MSG_PICKUP_PILE = MessageProtocol.fixed_frame(ClientMessageType.PICKUP_PILE)
+
+# Independent RNG for reconnect jitter (not coupled to the global random state)
+_reconnect_rng = random.SystemRandom()
+
+# Short-term reconnect window in monotonic nanoseconds (same clock as the heartbeat deadlines)
+_DISCONNECT_THRESHOLD_NS = constants.SHORT_TERM_DISCONNECT_THRESHOLD * 1_000_000_000
+
 
 class ConnectionManager(QObject):
     """
@@ -45,8 +57,16 @@ class ConnectionManager(QObject):
     - reconnected: Reconnection successful
     """
     
+    # Fixed attribute slots (sip wrappers keep their own __dict__, so it can't be listed here)
+    __slots__ = (
+        'logger', 'network_client', 'heartbeat', 'state', 'player_name',
+        '_last_host', '_last_port', '_disconnect_ns', 'reconnect_attempts',
+        'intentional_disconnect', '_connected_fast', 'reconnect_timer', '_send_buf', '_flush_timer',
+        '_message_handlers',
+    )
+    
     # Signals
-    state_changed = pyqtSignal(str, str)  # (old_state, new_state)
+    state_changed = pyqtSignal(int, int)  # (old_state, new_state) - constants.STATE_*
     message_received = pyqtSignal(dict)  # Incoming message
     error_occurred = pyqtSignal(str)  # Error message
     reconnecting = pyqtSignal()  # Auto-reconnection started
@@ -61,19 +81,44 @@ class ConnectionManager(QObject):
         
         # Components
         self.network_client: Optional[NetworkClient] = None
-        self.heartbeat: Optional[HeartbeatManager] = None
+        self.heartbeat = HeartbeatManager()  # Lives as long as the manager; stopped/started per connection
+        self._connect_heartbeat_signals()
         
         # State
         self.state = constants.STATE_DISCONNECTED
         self.player_name: str = ""
-        self.disconnect_time: Optional[datetime] = None
+        self._last_host: str = ""  # Host/port of the last connect() - empty until first connect
+        self._last_port: int = 0
+        self._disconnect_ns: int = 0  # time.monotonic_ns() of disconnect (0 = not disconnected)
         self.reconnect_attempts = 0
         self.intentional_disconnect = False
+        self._connected_fast = False  # Mirrors the client's connected/disconnected signals; checked on every send
         
-        # Reconnection timer
+        # Reconnection timer (single-shot, re-armed with a jittered backoff after each failed attempt)
         self.reconnect_timer = QTimer()
+        self.reconnect_timer.setSingleShot(True)
         self.reconnect_timer.timeout.connect(self._attempt_reconnect)
         
+        # Outgoing write buffer - messages sent in the same event-loop tick go out in one sendall
+        self._send_buf = bytearray()
+        self._flush_timer = QTimer()  # Zero-interval single-shot, reused for every flush
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(0)
+        self._flush_timer.timeout.connect(self._flush_send_buf)
+        
+        # Server message type -> state handler (messages without an entry are only forwarded to UI)
+        self._message_handlers = {
+            int(ServerMessageType.ERROR): self._on_error_message,
+            int(ServerMessageType.CONNECTED): self._on_connected_message,
+            int(ServerMessageType.PONG): self._on_pong_message,
+            int(ServerMessageType.ROOM_JOINED): self._on_room_joined_message,
+            int(ServerMessageType.ROOM_LEFT): self._on_room_left_message,
+            int(ServerMessageType.GAME_STARTED): self._on_game_started_message,
+            int(ServerMessageType.GAME_STATE): self._on_game_state_message,
+            int(ServerMessageType.TURN_UPDATE): self._on_turn_update_message,
+            int(ServerMessageType.GAME_OVER): self._on_game_over_message,
+        }
+        
         self.logger.info("ConnectionManager initialized")
     
     # ========================================================================
@@ -93,7 +138,7 @@ class ConnectionManager(QObject):
             True if connection initiated
         """
         if self.state != constants.STATE_DISCONNECTED:
-            self.logger.warning(f"Cannot connect - current state: {self.state}")
+            self.logger.warning("Cannot connect - current state: %s", constants.STATE_NAMES[self.state])
             return False
         
         self.player_name = player_name
@@ -132,10 +177,11 @@ class ConnectionManager(QObject):
         # Stop reconnection if active
         self.reconnect_timer.stop()
         
+        # Drop anything not yet flushed
+        self._send_buf.clear()
+        
         # Stop heartbeat
-        if self.heartbeat:
-            self.heartbeat.stop()
-            self.heartbeat = None
+        self.heartbeat.stop()
         
         # Stop network client
         if self.network_client:
@@ -157,10 +203,10 @@ class ConnectionManager(QObject):
             True if reconnection initiated
         """
         if self.state not in [constants.STATE_DISCONNECTED, constants.STATE_RECONNECTING]:
-            self.logger.warning(f"Cannot reconnect - current state: {self.state}")
+            self.logger.warning("Cannot reconnect - current state: %s", constants.STATE_NAMES[self.state])
             return False
 
-        if not hasattr(self, '_last_host') or not hasattr(self, '_last_port'):
+        if not self._last_host or not self._last_port:
             self.logger.error("Cannot reconnect - no previous connection info")
             return False
 
@@ -170,7 +216,7 @@ class ConnectionManager(QObject):
         self.reconnect_timer.stop()
 
         # Reset reconnect state
-        self.disconnect_time = datetime.now()
+        self._disconnect_ns = time.monotonic_ns()
         self.reconnect_attempts = 0
 
         # Start reconnection
@@ -178,18 +224,64 @@ class ConnectionManager(QObject):
 
         return True
     
-    def send_message(self, message: str):
+    def send_message(self, message: Union[str, bytes], flush_now: bool = False):
         """
         Send message to server.
         
+        Messages are buffered and flushed together on the next event-loop
+        iteration, so several sends in one tick cost a single socket write.
+        
         Args:
-            message: Protocol message string
+            message: Protocol message string, or an encoded frame ending with \n
+            flush_now: Write immediately (with anything already buffered) instead of waiting for the flush
         """
-        if not self.network_client or not self.network_client.is_connected():
+        # NetworkClient still checks its own socket state before writing
+        if not self._connected_fast:
             self.logger.warning("Cannot send message - not connected")
             return
         
-        self.network_client.send_message(message)
+        if isinstance(message, bytes):
+            self._send_buf += message  # Prebuilt frame - no encode needed
+        else:
+            if not message.endswith('\n'):
+                message += '\n'
+            self._send_buf += message.encode('utf-8')
+        
+        if flush_now:
+            self._flush_send_buf()
+        elif not self._flush_timer.isActive():
+            self._flush_timer.start()
+    
+    def send_messages(self, messages: List[str]):
+        """
+        Send several messages to server as one write.
+        
+        Anything already buffered goes out first, in the same sendall, so
+        ordering with earlier send_message() calls is preserved.
+        
+        Args:
+            messages: Protocol message strings (trailing \\n optional)
+        """
+        if not self._connected_fast:
+            self.logger.warning("Cannot send messages - not connected")
+            return
+        
+        lines = [message.rstrip('\n') for message in messages]
+        if lines:
+            self._send_buf += ('\n'.join(lines) + '\n').encode('utf-8')
+        self._flush_send_buf()
+    
+    def _flush_send_buf(self):
+        """Write all buffered outgoing messages with a single send"""
+        self._flush_timer.stop()
+        if not self._send_buf:
+            return
+        
+        payload = bytes(self._send_buf)
+        self._send_buf.clear()
+        
+        if self.network_client:
+            self.network_client.send_raw(payload)
     
     # ========================================================================
     # CONVENIENCE METHODS - Protocol Messages
@@ -197,18 +289,16 @@ class ConnectionManager(QObject):
     
     def send_connect(self, player_name: str):
         """Send CONNECT message"""
-        msg = MessageProtocol.build(ClientMessageType.CONNECT, name=player_name)
+        msg = MessageProtocol.build_frame(ClientMessageType.CONNECT, name=player_name)
         self.send_message(msg)
     
     def send_join_room(self):
         """Send JOIN_ROOM message"""
-        msg = MessageProtocol.build(ClientMessageType.JOIN_ROOM)
-        self.send_message(msg)
+        self.send_message(_MSG_JOIN_ROOM)
     
     def send_start_game(self):
         """Send START_GAME message"""
-        msg = MessageProtocol.build(ClientMessageType.START_GAME)
-        self.send_message(msg)
+        self.send_message(_MSG_START_GAME)
     
     def send_play_cards(self, cards: str):
         """
@@ -217,24 +307,23 @@ class ConnectionManager(QObject):
         Args:
             cards: Comma-separated card codes or "RESERVE"
         """
-        msg = MessageProtocol.build(ClientMessageType.PLAY_CARDS, cards=cards)
+        msg = MessageProtocol.build_frame(ClientMessageType.PLAY_CARDS, cards=cards)
         self.send_message(msg)
     
     def send_pickup_pile(self):
         """Send PICKUP_PILE message"""
-        msg = MessageProtocol.build(ClientMessageType.PICKUP_PILE)
-        self.send_message(msg)
+        self.send_message(_MSG_PICKUP_PILE)
     
     def send_reconnect(self, player_name: str):
         """Send RECONNECT message"""
-        msg = MessageProtocol.build(ClientMessageType.RECONNECT, name=player_name)
+        msg = MessageProtocol.build_frame(ClientMessageType.RECONNECT, name=player_name)
         self.send_message(msg)
     
     # ========================================================================
     # STATE MANAGEMENT
     # ========================================================================
     
-    def get_state(self) -> str:
+    def get_state(self) -> int:
         """Get current connection state"""
         return self.state
     
@@ -246,20 +335,20 @@ class ConnectionManager(QObject):
         """Check if in active game"""
         return self.state == constants.STATE_IN_GAME
     
-    def _change_state(self, new_state: str):
+    def _change_state(self, new_state: int):
         """
         Change connection state.
         
         Args:
             new_state: New state constant
         """
-        if new_state == self.state:
+        old_state = self.state
+        if new_state == old_state:
             return
         
-        old_state = self.state
         self.state = new_state
         
-        log_state_change(old_state, new_state)
+        log_state_change(constants.STATE_NAMES[old_state], constants.STATE_NAMES[new_state])
         self.state_changed.emit(old_state, new_state)
     
     # ========================================================================
@@ -268,13 +357,15 @@ class ConnectionManager(QObject):
     
     def _handle_disconnection(self):
         """Handle unexpected disconnection"""
-        # Only set disconnect_time on initial disconnect, not during reconnection attempts
+        # Messages buffered for the lost connection must not reach the next one
+        self._send_buf.clear()
+
+        # Only set disconnect time on initial disconnect, not during reconnection attempts
         if self.state != constants.STATE_RECONNECTING:
-            self.disconnect_time = datetime.now()
+            self._disconnect_ns = time.monotonic_ns()
 
         # Stop heartbeat
-        if self.heartbeat:
-            self.heartbeat.stop()
+        self.heartbeat.stop()
 
         # Start auto-reconnection (or continue existing reconnection)
         if self.state != constants.STATE_RECONNECTING:
@@ -289,22 +380,34 @@ class ConnectionManager(QObject):
         self._change_state(constants.STATE_RECONNECTING)
         self.reconnecting.emit()
         
-        # Start reconnection timer
-        self.reconnect_timer.start(constants.RECONNECT_RETRY_INTERVAL * 1000)
+        # Schedule first attempt
+        self._schedule_reconnect()
+    
+    def _schedule_reconnect(self):
+        """
+        Arm reconnect timer with exponential backoff and full jitter.
+
+        Delay is uniform in [0, min(cap, base * 2^attempts)) so clients that lost
+        the server at the same moment don't all retry at the same moment.
+        """
+        backoff_ms = min(constants.RECONNECT_CAP_MS,
+                         constants.RECONNECT_BASE_MS * (1 << min(self.reconnect_attempts, 6)))
+        delay_ms = _reconnect_rng.randrange(backoff_ms)
+        self.reconnect_timer.start(delay_ms)
     
     def _attempt_reconnect(self):
         """Attempt to reconnect"""
         self.reconnect_attempts += 1
 
         # Check if we're within the reconnect window
-        if self.disconnect_time:
-            elapsed = (datetime.now() - self.disconnect_time).total_seconds()
-            time_remaining = int(constants.SHORT_TERM_DISCONNECT_THRESHOLD - elapsed)
+        if self._disconnect_ns:
+            elapsed_ns = time.monotonic_ns() - self._disconnect_ns
+            time_remaining = (_DISCONNECT_THRESHOLD_NS - elapsed_ns) // 1_000_000_000
 
-            if elapsed > constants.SHORT_TERM_DISCONNECT_THRESHOLD:
+            if elapsed_ns > _DISCONNECT_THRESHOLD_NS:
                 # Short-term window expired - stop auto-reconnect
                 # Player can still manually reconnect (60-120s window)
-                self.logger.info(f"Disconnect exceeded {constants.SHORT_TERM_DISCONNECT_THRESHOLD}s - stopping auto-reconnect")
+                self.logger.info("Disconnect exceeded %ss - stopping auto-reconnect", constants.SHORT_TERM_DISCONNECT_THRESHOLD)
                 self.reconnect_timer.stop()
                 self._change_state(constants.STATE_DISCONNECTED)
                 self.error_occurred.emit(
@@ -316,7 +419,7 @@ class ConnectionManager(QObject):
                 return
 
             # Emit status update with time remaining
-            self.logger.info(f"Reconnect attempt #{self.reconnect_attempts} ({time_remaining}s remaining)")
+            self.logger.info("Reconnect attempt #%d (%ss remaining)", self.reconnect_attempts, time_remaining)
             self.reconnect_status.emit(time_remaining)
         
         # Attempt reconnection
@@ -328,18 +431,20 @@ class ConnectionManager(QObject):
             self.network_client = None
 
         # Create new client with same host/port
-        host = getattr(self, '_last_host', constants.DEFAULT_HOST)
-        port = getattr(self, '_last_port', constants.DEFAULT_PORT)
+        host = self._last_host or constants.DEFAULT_HOST
+        port = self._last_port or constants.DEFAULT_PORT
         self.network_client = NetworkClient(host, port)
         self._connect_network_signals()
         self.network_client.start()
 
         # Try to reconnect
         if self.network_client.connect_to_server():
-            # Connection successful - stop timer and wait for server response
-            self.reconnect_timer.stop()
+            # Connection successful - wait for server response
             # Send RECONNECT message
             self.send_reconnect(self.player_name)
+        else:
+            # Failed - try again after backoff
+            self._schedule_reconnect()
     
     def _on_reconnect_success(self):
         """Handle successful reconnection"""
@@ -347,14 +452,11 @@ class ConnectionManager(QObject):
         log_connection_event("RECONNECTED")
         
         self.reconnect_timer.stop()
-        self.disconnect_time = None
+        self._disconnect_ns = 0
         self.reconnect_attempts = 0
         
         # Restart heartbeat
-        if not self.heartbeat:
-            self.heartbeat = HeartbeatManager()
-            self._connect_heartbeat_signals()
-        self.heartbeat.start(self.network_client.send_message)
+        self.heartbeat.start(self.network_client.send_raw)
         
         self.reconnected.emit()
     
@@ -369,19 +471,17 @@ class ConnectionManager(QObject):
         
         self.network_client.connected.connect(self._on_network_connected)
         self.network_client.disconnected.connect(self._on_network_disconnected)
-        self.network_client.message_received.connect(self._on_message_received)
+        self.network_client.messages_received_batch.connect(self._on_messages_received_batch)
         self.network_client.error_occurred.connect(self._on_network_error)
     
     def _connect_heartbeat_signals(self):
         """Connect HeartbeatManager signals"""
-        if not self.heartbeat:
-            return
-        
         self.heartbeat.timeout_detected.connect(self._on_heartbeat_timeout)
     
     def _on_network_connected(self):
         """Handle network connected signal"""
         self.logger.info("Network connected")
+        self._connected_fast = True
 
         # Don't send CONNECT if we're reconnecting - RECONNECT will be sent instead
         if self.state == constants.STATE_RECONNECTING:
@@ -394,6 +494,7 @@ class ConnectionManager(QObject):
     def _on_network_disconnected(self):
         """Handle network disconnected signal"""
         self.logger.info("Network disconnected")
+        self._connected_fast = False
         
         # Only handle if we didn't initiate disconnect
         if self.state != constants.STATE_DISCONNECTED and not self.intentional_disconnect:
@@ -402,6 +503,16 @@ class ConnectionManager(QObject):
         # Reset flag
         self.intentional_disconnect = False
     
+    def _on_messages_received_batch(self, messages: list):
+        """
+        Handle a batch of incoming messages (one recv worth) from NetworkClient.
+
+        Args:
+            messages: Parsed message dictionaries, in arrival order
+        """
+        for message_dict in messages:
+            self._on_message_received(message_dict)
+
     def _on_message_received(self, message_dict: dict):
         """
         Handle incoming message from server.
@@ -409,79 +520,86 @@ class ConnectionManager(QObject):
         Args:
             message_dict: Parsed message dictionary
         """
-        msg_type = message_dict.get('type')
-
-        # Handle protocol messages that affect connection state
-        if msg_type == ServerMessageType.ERROR:
-            # Handle ERROR during connection phase
-            if self.state == constants.STATE_CONNECTING:
-                self.logger.warning("Connection rejected by server")
-                # Mark as intentional to prevent auto-reconnect
-                self.intentional_disconnect = True
-                # Disconnect and return to DISCONNECTED state
-                if self.network_client:
-                    self.network_client.stop()
-                    self.network_client = None
-                self._change_state(constants.STATE_DISCONNECTED)
-        elif msg_type == ServerMessageType.CONNECTED:
-            self._on_connected_message(message_dict)
-        elif msg_type == ServerMessageType.PONG:
-            self._on_pong_message()
-        elif msg_type == ServerMessageType.ROOM_JOINED:
-            self._change_state(constants.STATE_IN_ROOM)
-        elif msg_type == ServerMessageType.ROOM_LEFT:
-            # Player left room - back to connected state
-            self.logger.info("Left room - changing to CONNECTED state")
-            self._change_state(constants.STATE_CONNECTED)
-        elif msg_type == ServerMessageType.GAME_STARTED:
-            self._change_state(constants.STATE_IN_GAME)
-        elif msg_type == ServerMessageType.GAME_STATE:
-            # GAME_STATE indicates we're in an active game (e.g., after reconnection)
-            if self.state != constants.STATE_IN_GAME:
-                self.logger.info("Received GAME_STATE - changing to IN_GAME state")
-                self._change_state(constants.STATE_IN_GAME)
-        elif msg_type == ServerMessageType.TURN_UPDATE:
-            # TURN_UPDATE is only sent during active gameplay
-            # State should already be IN_GAME, but ensure it
-            if self.state != constants.STATE_IN_GAME:
-                self.logger.warning("Received TURN_UPDATE while not IN_GAME - fixing state")
-                self._change_state(constants.STATE_IN_GAME)
-        elif msg_type == ServerMessageType.GAME_OVER:
-            # Don't change state here - let ROOM_LEFT handle it
-            # This prevents auto-joining before server sends ROOM_LEFT
-            self.logger.info("Game over - waiting for ROOM_LEFT")
+        # Handle protocol messages that affect connection state (O(1) dispatch by type)
+        handler = self._message_handlers.get(message_dict.get('type'))
+        if handler:
+            handler(message_dict)
 
         # Forward message to UI
         self.message_received.emit(message_dict)
     
+    def _on_error_message(self, message_dict: dict):
+        """Handle ERROR message from server"""
+        # Handle ERROR during connection phase
+        if self.state == constants.STATE_CONNECTING:
+            self.logger.warning("Connection rejected by server")
+            # Mark as intentional to prevent auto-reconnect
+            self.intentional_disconnect = True
+            # Disconnect and return to DISCONNECTED state
+            if self.network_client:
+                self.network_client.stop()
+                self.network_client = None
+            self._change_state(constants.STATE_DISCONNECTED)
+    
+    def _on_room_joined_message(self, message_dict: dict):
+        """Handle ROOM_JOINED message from server"""
+        self._change_state(constants.STATE_IN_ROOM)
+    
+    def _on_room_left_message(self, message_dict: dict):
+        """Handle ROOM_LEFT message from server"""
+        # Player left room - back to connected state
+        self.logger.info("Left room - changing to CONNECTED state")
+        self._change_state(constants.STATE_CONNECTED)
+    
+    def _on_game_started_message(self, message_dict: dict):
+        """Handle GAME_STARTED message from server"""
+        self._change_state(constants.STATE_IN_GAME)
+    
+    def _on_game_state_message(self, message_dict: dict):
+        """Handle GAME_STATE message from server"""
+        # GAME_STATE indicates we're in an active game (e.g., after reconnection)
+        if self.state != constants.STATE_IN_GAME:
+            self.logger.info("Received GAME_STATE - changing to IN_GAME state")
+            self._change_state(constants.STATE_IN_GAME)
+    
+    def _on_turn_update_message(self, message_dict: dict):
+        """Handle TURN_UPDATE message from server"""
+        # TURN_UPDATE is only sent during active gameplay
+        # State should already be IN_GAME, but ensure it
+        if self.state != constants.STATE_IN_GAME:
+            self.logger.warning("Received TURN_UPDATE while not IN_GAME - fixing state")
+            self._change_state(constants.STATE_IN_GAME)
+    
+    def _on_game_over_message(self, message_dict: dict):
+        """Handle GAME_OVER message from server"""
+        # Don't change state here - let ROOM_LEFT handle it
+        # This prevents auto-joining before server sends ROOM_LEFT
+        self.logger.info("Game over - waiting for ROOM_LEFT")
+    
     def _on_connected_message(self, message_dict: dict):
         """Handle CONNECTED message from server"""
-        self.logger.debug(f"CONNECTED message received: {message_dict}")
+        self.logger.debug("CONNECTED message received: %s", message_dict)
         status = message_dict.get('data', {}).get('status')  # Parser expands 'st' to 'status'
-        self.logger.debug(f"Status value: {repr(status)}")
+        self.logger.debug("Status value: %r", status)
 
         if status == 'success':  # Parser expands 'ok' to 'success'
             self.logger.info("Connection successful")
             self._change_state(constants.STATE_CONNECTED)
             
             # Start heartbeat
-            if not self.heartbeat:
-                self.heartbeat = HeartbeatManager()
-                self._connect_heartbeat_signals()
-            self.heartbeat.start(self.network_client.send_message)
+            self.heartbeat.start(self.network_client.send_raw)
             
             # Check if this was a reconnection
             if self.reconnect_attempts > 0:
                 self._on_reconnect_success()
     
-    def _on_pong_message(self):
+    def _on_pong_message(self, message_dict: dict):
         """Handle PONG message from server"""
-        if self.heartbeat:
-            self.heartbeat.on_pong_received()
+        self.heartbeat.on_pong_received()
     
     def _on_network_error(self, error_msg: str):
         """Handle network error"""
-        self.logger.error(f"Network error: {error_msg}")
+        self.logger.error("Network error: %s", error_msg)
         self.error_occurred.emit(error_msg)
     
     def _on_heartbeat_timeout(self):
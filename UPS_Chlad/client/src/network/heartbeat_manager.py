@@ -3,12 +3,24 @@ Heartbeat manager for keeping connection alive.
 Sends PING every 30 seconds and detects timeouts.
 """
 
-from PyQt5.QtCore import QObject, QTimer, pyqtSignal
-from datetime import datetime, timedelta
+import logging
+import random
+import time
+from PyQt5.QtCore import QObject, QTimer, Qt, pyqtSignal
 
 from message import MessageProtocol, ClientMessageType, ServerMessageType
 from utils import get_logger, log_connection_event, constants
 
+# PING has no dynamic fields - send the prebuilt, already encoded frame
+_PING_FRAME = MessageProtocol.fixed_frame(ClientMessageType.PING)
+
+# Heartbeat deadlines in monotonic nanoseconds
+_NS_PER_MS = 1_000_000
+_PING_INTERVAL_NS = constants.PING_INTERVAL * 1_000_000_000
+_PONG_TIMEOUT_NS = constants.PONG_TIMEOUT * 1_000_000_000
+_PING_JITTER = 0.1  # +/-10% per start() so reconnected clients don't PING in lockstep
+_ping_jitter_rng = random.SystemRandom()  # Own RNG, like the reconnect backoff jitter
+
 
 class HeartbeatManager(QObject):
     """
@@ -29,6 +41,12 @@ class HeartbeatManager(QObject):
         heartbeat.start(send_message_func)
     """
     
+    # Fixed attribute slots (sip wrappers keep their own __dict__, so it can't be listed here)
+    __slots__ = (
+        'logger', 'ping_timer', 'running', 'send_message_callback',
+        'ping_interval_ns', 'last_ping_ns', 'pong_deadline_ns', 'waiting_for_pong',
+    )
+    
     # Signals
     timeout_detected = pyqtSignal()  # Server not responding
     ping_sent = pyqtSignal()  # PING sent
@@ -40,18 +58,21 @@ class HeartbeatManager(QObject):
         
         self.logger = get_logger()
         
-        # Timer for sending PING
+        # Single timer for both PING sending and PONG timeout - re-armed for
+        # whichever deadline comes first
         self.ping_timer = QTimer()
-        self.ping_timer.timeout.connect(self._send_ping)
-        
-        # Timer for detecting PONG timeout
-        self.pong_timer = QTimer()
-        self.pong_timer.timeout.connect(self._check_pong_timeout)
+        self.ping_timer.setSingleShot(True)
+        # Coarse (~5% slack) lets the OS batch wakeups; VeryCoarse would round
+        # to whole seconds, too loose for a 2s ping / 2s pong deadline
+        self.ping_timer.setTimerType(Qt.CoarseTimer)
+        self.ping_timer.timeout.connect(self._on_timer)
         
         # State
         self.running = False
         self.send_message_callback = None
-        self.last_ping_time: datetime = None
+        self.ping_interval_ns: int = _PING_INTERVAL_NS  # Jittered per start()
+        self.last_ping_ns: int = 0  # time.monotonic_ns() of last PING
+        self.pong_deadline_ns: int = 0  # time.monotonic_ns() by which PONG must arrive
         self.waiting_for_pong = False
         
         self.logger.info("HeartbeatManager initialized")
@@ -61,7 +82,7 @@ class HeartbeatManager(QObject):
         Start heartbeat.
         
         Args:
-            send_message_callback: Function to call to send messages (e.g., network_client.send_message)
+            send_message_callback: Function to call with encoded frames (e.g., network_client.send_raw)
         """
         if self.running:
             self.logger.warning("Heartbeat already running")
@@ -69,14 +90,13 @@ class HeartbeatManager(QObject):
         
         self.send_message_callback = send_message_callback
         self.running = True
+        self.ping_interval_ns = int(_PING_INTERVAL_NS * _ping_jitter_rng.uniform(1 - _PING_JITTER, 1 + _PING_JITTER))
         
-        # Start PING timer (send every 30 seconds)
-        self.ping_timer.start(constants.PING_INTERVAL * 1000)  # Convert to milliseconds
-        
-        # Send first PING immediately
+        # Send first PING immediately (arms the timer for the next deadline)
         self._send_ping()
+        self._arm_timer(self.last_ping_ns)
         
-        self.logger.info(f"Heartbeat started (PING every {constants.PING_INTERVAL}s)")
+        self.logger.info("Heartbeat started (PING every %.2fs)", self.ping_interval_ns / 1e9)
         log_connection_event("HEARTBEAT_STARTED")
     
     def stop(self):
@@ -86,8 +106,9 @@ class HeartbeatManager(QObject):
         
         self.running = False
         self.ping_timer.stop()
-        self.pong_timer.stop()
         self.waiting_for_pong = False
+        self.last_ping_ns = 0
+        self.pong_deadline_ns = 0
         
         self.logger.info("Heartbeat stopped")
         log_connection_event("HEARTBEAT_STOPPED")
@@ -100,13 +121,13 @@ class HeartbeatManager(QObject):
             self.logger.warning("Received PONG but wasn't waiting for one")
             return
         
-        # Calculate round-trip time
-        if self.last_ping_time:
-            rtt = (datetime.now() - self.last_ping_time).total_seconds()
-            self.logger.debug(f"PONG received (RTT: {rtt:.3f}s)")
+        # Calculate round-trip time (only worth the clock read when DEBUG is on)
+        if self.last_ping_ns and self.logger.isEnabledFor(logging.DEBUG):
+            rtt = (time.monotonic_ns() - self.last_ping_ns) / 1e9
+            self.logger.debug("PONG received (RTT: %.3fs)", rtt)
         
+        # The pending timer tick notices there's no PONG deadline any more
         self.waiting_for_pong = False
-        self.pong_timer.stop()
         self.pong_received.emit()
     
     def _send_ping(self):
@@ -114,31 +135,52 @@ class HeartbeatManager(QObject):
         if not self.running or not self.send_message_callback:
             return
         
-        # Build PING message
-        ping_message = MessageProtocol.build(ClientMessageType.PING)
-        
         # Send
-        self.send_message_callback(ping_message)
-        
-        # Track state
-        self.last_ping_time = datetime.now()
-        self.waiting_for_pong = True
+        self.send_message_callback(_PING_FRAME)
         
-        # Start timeout timer (expect PONG within PONG_TIMEOUT seconds)
-        self.pong_timer.start(constants.PONG_TIMEOUT * 1000)
+        # Track state (expect PONG within PONG_TIMEOUT seconds of the oldest unanswered PING)
+        self.last_ping_ns = time.monotonic_ns()
+        if not self.waiting_for_pong:
+            self.waiting_for_pong = True
+            self.pong_deadline_ns = self.last_ping_ns + _PONG_TIMEOUT_NS
         
-        self.logger.debug("PING sent")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("PING sent")
         self.ping_sent.emit()
     
-    def _check_pong_timeout(self):
-        """Check if PONG timeout occurred"""
-        if self.waiting_for_pong:
-            self.logger.warning(f"PONG timeout - no response within {constants.PONG_TIMEOUT}s")
+    def _on_timer(self):
+        """Handle the next heartbeat deadline: PONG timeout or PING due"""
+        if not self.running:
+            return
+        
+        now = time.monotonic_ns()
+        
+        if self.waiting_for_pong and now >= self.pong_deadline_ns:
+            self.logger.warning("PONG timeout - no response within %ss", constants.PONG_TIMEOUT)
             log_connection_event("PONG_TIMEOUT", f"No response within {constants.PONG_TIMEOUT}s")
             
             self.waiting_for_pong = False
             self.stop()  # Stop heartbeat
             self.timeout_detected.emit()
+            return
+        
+        if now - self.last_ping_ns >= self.ping_interval_ns:
+            self._send_ping()
+            now = self.last_ping_ns
+        
+        self._arm_timer(now)
+    
+    def _arm_timer(self, now: int):
+        """
+        Arm the timer for the earliest pending deadline.
+        
+        Args:
+            now: Current time.monotonic_ns()
+        """
+        deadline = self.last_ping_ns + self.ping_interval_ns
+        if self.waiting_for_pong and self.pong_deadline_ns < deadline:
+            deadline = self.pong_deadline_ns
+        self.ping_timer.start(max(0, -((now - deadline) // _NS_PER_MS)))  # Round up to whole ms
     
     def is_running(self) -> bool:
         """Check if heartbeat is running"""
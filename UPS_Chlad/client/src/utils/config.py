@@ -3,21 +3,70 @@ Configuration management for the Gamba client.
 Saves and loads user settings (last used IP/port/name, UI preferences, etc.).
 """
 
-import configparser
+import atexit
+import itertools
 import os
-from typing import Optional, Dict, Any
+import sys
+import threading
+import weakref
+from typing import Optional, Dict, Any, Tuple
+
+from PyQt5.QtCore import QTimer
 
 from .constants import (
     CONFIG_FILE_NAME,
     CONFIG_SECTION_CONNECTION,
     CONFIG_SECTION_PLAYER,
     CONFIG_SECTION_UI,
-    DEFAULT_CONFIG,
+    DEFAULT_CONFIG_ITEMS,
     DEFAULT_HOST,
     DEFAULT_PORT
 )
 from .logger import get_logger
 
+# Value types for options read through typed getters (everything else is str)
+_OPTION_TYPES = {
+    (CONFIG_SECTION_CONNECTION, "port"): int,
+    (CONFIG_SECTION_CONNECTION, "auto_reconnect"): bool,
+    (CONFIG_SECTION_PLAYER, "remember_name"): bool,
+    (CONFIG_SECTION_UI, "window_width"): int,
+    (CONFIG_SECTION_UI, "window_height"): int,
+    (CONFIG_SECTION_UI, "show_debug_info"): bool,
+}
+
+# Accepted boolean spellings (same set configparser accepts)
+_BOOLEAN_STATES = {
+    '1': True, 'yes': True, 'true': True, 'on': True,
+    '0': False, 'no': False, 'false': False, 'off': False,
+}
+
+
+# Configs with unsaved changes - written by the single atexit hook below.
+# Weak, so a Config dropped by its owner isn't kept alive (or written) at exit.
+_dirty_configs: "weakref.WeakSet[Config]" = weakref.WeakSet()
+
+# Orders changes and writes across instances: {config file: sequence number of its last write}
+_sequence = itertools.count(1)
+_last_write: Dict[str, int] = {}
+
+
+@atexit.register
+def _save_dirty_configs():
+    """Write configs that were changed with set() but never saved"""
+    for config in sorted(_dirty_configs, key=lambda c: c._changed_at):
+        # Skip changes older than the file's last write - they would overwrite a newer save
+        if config._changed_at > _last_write.get(config.config_file, 0):
+            config._write_now()
+
+
+def _serialize(value: Any) -> str:
+    """Convert a typed config value to its INI string form"""
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    return str(value)
+
 
 class Config:
     """
@@ -43,50 +92,195 @@ class Config:
             config_file: Path to config file
         """
         self.config_file = config_file
-        self.config = configparser.ConfigParser()
+        self.config: Dict[str, Dict[str, str]] = {}  # {section: {option: raw value}} as read/written
         self.logger = get_logger()
         
-        # Initialize with defaults
-        self._set_defaults()
+        # Authoritative typed values keyed by (section, option) - setters write here,
+        # strings are only produced when saving
+        self._values: Dict[Tuple[str, str], Any] = {}
+        self._config_stale = False  # True when _values has changes not yet serialized into self.config
+        
+        # Unsaved changes + pending debounced write (see flush())
+        self._dirty = False
+        self._changed_at = 0  # Sequence number of the last change (see _save_dirty_configs())
+        self._lock = threading.Lock()
+        self._flush_timer: Optional[QTimer] = None  # Created on first flush()
+        
+        # Defaults and the file are applied on first use (see _ensure_loaded())
+        self._loaded = False
     
     def _set_defaults(self):
         """Set default configuration values"""
-        for section, options in DEFAULT_CONFIG.items():
-            if not self.config.has_section(section):
-                self.config.add_section(section)
-            for key, value in options.items():
-                self.config.set(section, key, value)
+        config = self.config
+        for section, key, value in DEFAULT_CONFIG_ITEMS:
+            config.setdefault(section, {})[key] = value
+    
+    def _coerce(self, section: str, option: str, raw: str) -> Any:
+        """
+        Convert a raw config string to the option's type.
+        
+        Raises:
+            ValueError: If the value can't be converted
+        """
+        value_type = _OPTION_TYPES.get((section, option), str)
+        if value_type is bool:
+            try:
+                return _BOOLEAN_STATES[raw.lower()]
+            except KeyError:
+                raise ValueError(f"Not a boolean: {raw}")
+        if value_type is int:
+            return int(raw)
+        return raw
+    
+    def _rebuild_values(self):
+        """Coerce every raw option into the typed values (invalid ones fall back in the getters)"""
+        self._values.clear()
+        self._config_stale = False
+        for section, options in self.config.items():
+            for option, raw in options.items():
+                try:
+                    self._values[(section, option)] = self._coerce(section, option, raw)
+                except ValueError:
+                    pass
+    
+    def _store(self, section: str, option: str, value: Any):
+        """Set a typed option value"""
+        self._ensure_loaded()
+        key = (section, option.lower())
+        with self._lock:
+            if key in self._values and self._values[key] == value:
+                return  # Unchanged - nothing to save
+            self._values[key] = value
+            self._config_stale = True
+            self._dirty = True
+            self._changed_at = next(_sequence)
+            _dirty_configs.add(self)
+    
+    def _sync_config(self):
+        """Serialize the typed values back into self.config (no-op if nothing changed)"""
+        if not self._config_stale:
+            return
+        self._config_stale = False
+        for (section, option), value in self._values.items():
+            self.config.setdefault(section, {})[option] = _serialize(value)
+    
+    def _ensure_loaded(self):
+        """Apply defaults and read the config file on first access"""
+        if not self._loaded:
+            self.load()
     
     def load(self) -> bool:
         """
         Load configuration from file.
         
+        Called automatically on first access; call explicitly to re-read the file.
+        
         Returns:
             True if loaded successfully, False otherwise
         """
+        if not self._loaded:
+            self._loaded = True
+            self._set_defaults()
+            self._rebuild_values()
+        
         if not os.path.exists(self.config_file):
             self.logger.info(f"Config file not found: {self.config_file} - using defaults")
             return False
         
         try:
-            self.config.read(self.config_file, encoding='utf-8')
+            self._read_file()
+            self._rebuild_values()
             self.logger.info(f"Configuration loaded from {self.config_file}")
             return True
         except Exception as e:
             self.logger.error(f"Failed to load config: {e}")
             self._set_defaults()  # Restore defaults
+            self._rebuild_values()
             return False
     
-    def save(self) -> bool:
+    def _read_file(self):
+        """
+        Parse the INI file into self.config (single pass, no interpolation).
+        
+        Raises:
+            ValueError: If a line is neither a section header nor key = value
+        """
+        options = None
+        with open(self.config_file, 'r', encoding='utf-8') as f:
+            for line_no, line in enumerate(f, 1):
+                line = line.strip()
+                if not line or line[0] in '#;':
+                    continue
+                # Section/option names become dict keys compared against the
+                # (interned) constants - intern them so lookups hit by identity
+                if line[0] == '[' and line[-1] == ']':
+                    options = self.config.setdefault(sys.intern(line[1:-1].strip()), {})
+                    continue
+                key, sep, value = line.partition('=')
+                if not sep or options is None:
+                    raise ValueError(f"Invalid line {line_no}: {line}")
+                options[sys.intern(key.strip().lower())] = value.strip()
+    
+    def save(self, force: bool = False) -> bool:
         """
         Save configuration to file.
         
+        Skips the write when nothing changed since the last save.
+        
+        Args:
+            force: Write even if there are no unsaved changes
+        
+        Returns:
+            True if saved successfully (or nothing to save), False otherwise
+        """
+        self._ensure_loaded()
+        self._cancel_flush()
+        if not self._dirty and not force:
+            return True
+        return self._write_now()
+    
+    def flush(self, delay_ms: int = 500):
+        """
+        Save after a short delay, coalescing repeated calls into one write.
+        
+        Each call restarts the delay, so a burst of setting changes results
+        in a single file write. Runs on the Qt event loop of the calling
+        thread; a write still pending at exit is done by the atexit hook.
+        
+        Args:
+            delay_ms: Delay before writing, in milliseconds
+        """
+        if self._flush_timer is None:
+            self._flush_timer = QTimer()
+            self._flush_timer.setSingleShot(True)
+            self._flush_timer.timeout.connect(self.save)
+        self._flush_timer.start(delay_ms)  # Restarts if already running
+    
+    def _cancel_flush(self):
+        """Cancel a pending debounced write"""
+        if self._flush_timer is not None:
+            self._flush_timer.stop()
+    
+    def _write_now(self) -> bool:
+        """
+        Write configuration to file immediately.
+        
         Returns:
             True if saved successfully, False otherwise
         """
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                self.config.write(f)
+            with self._lock:
+                self._sync_config()
+                lines = []
+                for section, options in self.config.items():
+                    lines.append(f"[{section}]\n")
+                    lines.extend(f"{option} = {value}\n" for option, value in options.items())
+                    lines.append("\n")
+                with open(self.config_file, 'w', encoding='utf-8') as f:
+                    f.writelines(lines)
+                self._dirty = False
+                _last_write[self.config_file] = next(_sequence)
+            _dirty_configs.discard(self)
             self.logger.info(f"Configuration saved to {self.config_file}")
             return True
         except Exception as e:
@@ -99,30 +293,30 @@ class Config:
     
     def get_connection_host(self) -> str:
         """Get server host"""
-        return self.config.get(CONFIG_SECTION_CONNECTION, "host", fallback=DEFAULT_HOST)
+        self._ensure_loaded()
+        return self._values.get((CONFIG_SECTION_CONNECTION, "host"), DEFAULT_HOST)
     
     def set_connection_host(self, host: str):
         """Set server host"""
-        self.config.set(CONFIG_SECTION_CONNECTION, "host", host)
+        self._store(CONFIG_SECTION_CONNECTION, "host", host)
     
     def get_connection_port(self) -> int:
         """Get server port"""
-        try:
-            return self.config.getint(CONFIG_SECTION_CONNECTION, "port", fallback=DEFAULT_PORT)
-        except ValueError:
-            return DEFAULT_PORT
+        self._ensure_loaded()
+        return self._values.get((CONFIG_SECTION_CONNECTION, "port"), DEFAULT_PORT)
     
     def set_connection_port(self, port: int):
         """Set server port"""
-        self.config.set(CONFIG_SECTION_CONNECTION, "port", str(port))
+        self._store(CONFIG_SECTION_CONNECTION, "port", port)
     
     def get_auto_reconnect(self) -> bool:
         """Get auto-reconnect setting"""
-        return self.config.getboolean(CONFIG_SECTION_CONNECTION, "auto_reconnect", fallback=True)
+        self._ensure_loaded()
+        return self._values.get((CONFIG_SECTION_CONNECTION, "auto_reconnect"), True)
     
     def set_auto_reconnect(self, enabled: bool):
         """Set auto-reconnect setting"""
-        self.config.set(CONFIG_SECTION_CONNECTION, "auto_reconnect", str(enabled).lower())
+        self._store(CONFIG_SECTION_CONNECTION, "auto_reconnect", enabled)
     
     # ========================================================================
     # PLAYER SETTINGS
@@ -130,19 +324,21 @@ class Config:
     
     def get_last_player_name(self) -> str:
         """Get last used player name"""
-        return self.config.get(CONFIG_SECTION_PLAYER, "last_name", fallback="")
+        self._ensure_loaded()
+        return self._values.get((CONFIG_SECTION_PLAYER, "last_name"), "")
     
     def set_last_player_name(self, name: str):
         """Set last used player name"""
-        self.config.set(CONFIG_SECTION_PLAYER, "last_name", name)
+        self._store(CONFIG_SECTION_PLAYER, "last_name", name)
     
     def get_remember_name(self) -> bool:
         """Get whether to remember player name"""
-        return self.config.getboolean(CONFIG_SECTION_PLAYER, "remember_name", fallback=True)
+        self._ensure_loaded()
+        return self._values.get((CONFIG_SECTION_PLAYER, "remember_name"), True)
     
     def set_remember_name(self, enabled: bool):
         """Set whether to remember player name"""
-        self.config.set(CONFIG_SECTION_PLAYER, "remember_name", str(enabled).lower())
+        self._store(CONFIG_SECTION_PLAYER, "remember_name", enabled)
     
     # ========================================================================
     # UI SETTINGS
@@ -155,25 +351,24 @@ class Config:
         Returns:
             (width, height) tuple
         """
-        try:
-            width = self.config.getint(CONFIG_SECTION_UI, "window_width", fallback=800)
-            height = self.config.getint(CONFIG_SECTION_UI, "window_height", fallback=600)
-            return (width, height)
-        except ValueError:
-            return (800, 600)
+        self._ensure_loaded()
+        width = self._values.get((CONFIG_SECTION_UI, "window_width"), 800)
+        height = self._values.get((CONFIG_SECTION_UI, "window_height"), 600)
+        return (width, height)
     
     def set_window_size(self, width: int, height: int):
         """Set window size"""
-        self.config.set(CONFIG_SECTION_UI, "window_width", str(width))
-        self.config.set(CONFIG_SECTION_UI, "window_height", str(height))
+        self._store(CONFIG_SECTION_UI, "window_width", width)
+        self._store(CONFIG_SECTION_UI, "window_height", height)
     
     def get_show_debug_info(self) -> bool:
         """Get whether to show debug information in UI"""
-        return self.config.getboolean(CONFIG_SECTION_UI, "show_debug_info", fallback=False)
+        self._ensure_loaded()
+        return self._values.get((CONFIG_SECTION_UI, "show_debug_info"), False)
     
     def set_show_debug_info(self, enabled: bool):
         """Set whether to show debug information in UI"""
-        self.config.set(CONFIG_SECTION_UI, "show_debug_info", str(enabled).lower())
+        self._store(CONFIG_SECTION_UI, "show_debug_info", enabled)
     
     # ========================================================================
     # GENERIC GETTERS/SETTERS
@@ -191,7 +386,12 @@ class Config:
         Returns:
             Config value or fallback
         """
-        return self.config.get(section, option, fallback=fallback)
+        self._ensure_loaded()
+        option = option.lower()  # Option names are case-insensitive, as with configparser
+        key = (section, option)
+        if key in self._values:
+            return _serialize(self._values[key])
+        return self.config.get(section, {}).get(option, fallback)
     
     def set(self, section: str, option: str, value: str):
         """
@@ -202,9 +402,18 @@ class Config:
             option: Config option
             value: Value to set
         """
-        if not self.config.has_section(section):
-            self.config.add_section(section)
-        self.config.set(section, option, value)
+        option = option.lower()
+        try:
+            self._store(section, option, self._coerce(section, option, value))
+        except ValueError:
+            # Keep the raw string (saved as-is); typed getters fall back to their defaults
+            self._ensure_loaded()
+            with self._lock:
+                self._values.pop((section, option), None)
+                self.config.setdefault(section, {})[option] = value
+                self._dirty = True
+                self._changed_at = next(_sequence)
+            _dirty_configs.add(self)
     
     def to_dict(self) -> Dict[str, Dict[str, str]]:
         """
@@ -213,10 +422,10 @@ class Config:
         Returns:
             Dictionary of {section: {option: value}}
         """
-        result = {}
-        for section in self.config.sections():
-            result[section] = dict(self.config.items(section))
-        return result
+        self._ensure_loaded()
+        with self._lock:
+            self._sync_config()
+            return {section: dict(options) for section, options in self.config.items()}
     
     def __repr__(self):
-        return f"Config(file={self.config_file}, sections={list(self.config.sections())})"
+        return f"Config(file={self.config_file}, sections={list(self.config)})"
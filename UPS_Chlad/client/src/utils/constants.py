@@ -18,13 +18,18 @@ RECONNECT_WINDOW = 120  # Server keeps player for 120s after disconnect
 
 # Connection retry settings
 SHORT_TERM_DISCONNECT_THRESHOLD = 60  # Automatic reconnection < 60s
-RECONNECT_RETRY_INTERVAL = 2  # Try reconnecting every 2 seconds
+RECONNECT_BASE_MS = 500   # Backoff base delay (doubles per attempt)
+RECONNECT_CAP_MS = 8000   # Backoff delay cap
 RECONNECT_MAX_ATTEMPTS = 5  # Max auto-reconnect attempts
 
 # Socket settings
 SOCKET_RECV_BUFFER_SIZE = 4096  # 4KB receive buffer
 SOCKET_TIMEOUT = 5.0  # 5 second socket timeout
+SOCKET_DRAIN_MAX_READS = 16  # Max extra non-blocking recv calls per wakeup
+SOCKET_KERNEL_RCVBUF = 128 * 1024  # 128KB kernel receive buffer (SO_RCVBUF)
+SOCKET_KERNEL_SNDBUF = 64 * 1024   # 64KB kernel send buffer (SO_SNDBUF)
 MESSAGE_BUFFER_MAX_SIZE = 1024 * 1024  # 1MB max buffer size
+MESSAGE_BATCH_MAX = 32  # Max parsed messages per cross-thread batch signal
 
 # ============================================================================
 # PROTOCOL CONSTANTS
@@ -34,6 +39,8 @@ MESSAGE_BUFFER_MAX_SIZE = 1024 * 1024  # 1MB max buffer size
 INVALID_MESSAGE_THRESHOLD = 3  # Disconnect after N invalid messages
 MAX_PLAYER_NAME_LENGTH = 32
 VALID_NAME_CHARS = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-"
+# str.translate table deleting every valid char - a name is valid if nothing is left
+VALID_NAME_CHARS_DELETE = str.maketrans('', '', VALID_NAME_CHARS)
 
 # Card format validation
 VALID_RANKS = ["2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A"]
@@ -86,6 +93,9 @@ WINDOW_MIN_HEIGHT = 600
 UI_UPDATE_INTERVAL = 100  # Refresh UI every 100ms if needed
 STATUS_MESSAGE_DURATION = 5000  # Status messages last 5 seconds
 
+# Game log
+GAME_LOG_MAX_ENTRIES = 500  # Oldest log lines are dropped beyond this
+
 # Colors (for card suits, if using styled widgets)
 COLOR_HEARTS = "#FF0000"
 COLOR_DIAMONDS = "#FF0000"
@@ -100,6 +110,7 @@ COLOR_SPADES = "#000000"
 LOG_FILE_NAME = "gamba_client.log"
 LOG_MAX_SIZE = 10 * 1024 * 1024  # 10MB max log file size
 LOG_BACKUP_COUNT = 3  # Keep 3 backup log files
+LOG_WRITE_BUFFER_SIZE = 64 * 1024  # 64KB file write buffer (flushed on WARNING+ and on close)
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
@@ -135,18 +146,37 @@ DEFAULT_CONFIG = {
     }
 }
 
+# Same defaults flattened to (section, key, value) triples for a single-loop apply
+DEFAULT_CONFIG_ITEMS = tuple(
+    (section, key, value)
+    for section, options in DEFAULT_CONFIG.items()
+    for key, value in options.items()
+)
+
 # ============================================================================
 # STATE MACHINE CONSTANTS
 # ============================================================================
 
 # Connection states (used by connection_manager.py)
-STATE_DISCONNECTED = "DISCONNECTED"
-STATE_CONNECTING = "CONNECTING"
-STATE_CONNECTED = "CONNECTED"      # Connected but not in room
-STATE_IN_LOBBY = "IN_LOBBY"        # In room selection
-STATE_IN_ROOM = "IN_ROOM"          # In room, waiting for game
-STATE_IN_GAME = "IN_GAME"          # Game active
-STATE_RECONNECTING = "RECONNECTING"  # Attempting reconnection
+# Small ints: cheap to compare and to marshal through Qt signals
+STATE_DISCONNECTED = 0
+STATE_CONNECTING = 1
+STATE_CONNECTED = 2      # Connected but not in room
+STATE_IN_LOBBY = 3       # In room selection
+STATE_IN_ROOM = 4        # In room, waiting for game
+STATE_IN_GAME = 5        # Game active
+STATE_RECONNECTING = 6   # Attempting reconnection
+
+# State names for logging/display (indexed by state constant)
+STATE_NAMES = (
+    "DISCONNECTED",
+    "CONNECTING",
+    "CONNECTED",
+    "IN_LOBBY",
+    "IN_ROOM",
+    "IN_GAME",
+    "RECONNECTING",
+)
 
 # ============================================================================
 # ERROR MESSAGES
@@ -3,21 +3,78 @@ Logging system for the Gamba client.
 Provides file and console logging with proper formatting.
 """
 
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 from typing import Optional
 
 from .constants import (
     LOG_FILE_NAME,
     LOG_MAX_SIZE,
     LOG_BACKUP_COUNT,
+    LOG_WRITE_BUFFER_SIZE,
     LOG_FORMAT,
     LOG_DATE_FORMAT,
     LOG_LEVEL_CONSOLE,
     LOG_LEVEL_FILE
 )
 
+# Level name -> logging constant
+_LOG_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL
+}
+
+# The configured GambaClient logger (None until first use - see GameLogger)
+_LOGGER: Optional[logging.Logger] = None
+
+
+class _BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    RotatingFileHandler that buffers writes instead of flushing every record.
+    
+    The file is opened lazily with a large write buffer. Records below
+    WARNING stay in the buffer until it fills, rotates or is closed; WARNING
+    and above are flushed immediately so problems reach disk even on a crash.
+    The file size is tracked in Python, because the stock rollover check
+    seeks the stream on every record, which would flush the buffer.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        self._size = 0  # Characters written to the current file
+        self._pending = 0  # Length of the record being emitted
+        self._flush_record = False
+        super().__init__(*args, delay=True, **kwargs)
+    
+    def _open(self):
+        stream = open(self.baseFilename, self.mode, buffering=LOG_WRITE_BUFFER_SIZE,
+                      encoding=self.encoding, errors=self.errors)
+        self._size = stream.tell()  # Append mode - starts at the current end of file
+        return stream
+    
+    def shouldRollover(self, record) -> bool:
+        self._pending = len(self.format(record)) + len(self.terminator)
+        if self.maxBytes <= 0:
+            return False
+        if self.stream is None:
+            self.stream = self._open()
+        return self._size + self._pending >= self.maxBytes
+    
+    def emit(self, record):
+        self._flush_record = record.levelno >= logging.WARNING
+        super().emit(record)
+        self._size += self._pending
+    
+    def flush(self):
+        # Per-record flushes are skipped; close() still flushes the buffer
+        if self._flush_record:
+            super().flush()
+
 
 class GameLogger:
     """
@@ -37,8 +94,7 @@ class GameLogger:
         logger.log_state_change("DISCONNECTED", "CONNECTED")
     """
     
-    _instance: Optional['GameLogger'] = None
-    _logger: Optional[logging.Logger] = None
+    _listener: Optional[logging.handlers.QueueListener] = None
     
     def __init__(self, log_dir: str = "logs", log_file: str = LOG_FILE_NAME):
         """
@@ -48,12 +104,21 @@ class GameLogger:
             log_dir: Directory for log files (created if doesn't exist)
             log_file: Name of the log file
         """
-        if GameLogger._logger is not None:
+        if _LOGGER is not None:
             return  # Already initialized
         
+        self._setup_handlers(log_dir, log_file)
+    
+    def _setup_handlers(self, log_dir: str, log_file: str):
+        """
+        Create the log directory, file handler and queue listener.
+        
+        Args:
+            log_dir: Directory for log files (created if doesn't exist)
+            log_file: Name of the log file
+        """
         # Create log directory if it doesn't exist
-        if not os.path.exists(log_dir):
-            os.makedirs(log_dir)
+        os.makedirs(log_dir, exist_ok=True)
         
         log_path = os.path.join(log_dir, log_file)
         
@@ -65,7 +130,7 @@ class GameLogger:
         self._logger.handlers.clear()
         
         # File handler with rotation
-        file_handler = logging.handlers.RotatingFileHandler(
+        file_handler = _BufferedRotatingFileHandler(
             log_path,
             maxBytes=LOG_MAX_SIZE,
             backupCount=LOG_BACKUP_COUNT,
@@ -74,7 +139,17 @@ class GameLogger:
         file_handler.setLevel(self._get_log_level(LOG_LEVEL_FILE))
         file_formatter = logging.Formatter(LOG_FORMAT, LOG_DATE_FORMAT)
         file_handler.setFormatter(file_formatter)
-        self._logger.addHandler(file_handler)
+        
+        # Callers (mostly the GUI thread) only enqueue records; a background
+        # listener thread does the formatting and blocking file writes
+        log_queue = queue.SimpleQueue()
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        self._logger.addHandler(queue_handler)
+        GameLogger._listener = logging.handlers.QueueListener(
+            log_queue, file_handler, respect_handler_level=True
+        )
+        GameLogger._listener.start()
+        atexit.register(self._stop_listener, queue_handler, file_handler)
         
         # Console handler
         # console_handler = logging.StreamHandler()
@@ -84,36 +159,41 @@ class GameLogger:
         # self._logger.addHandler(console_handler)
         
         # Store reference
-        GameLogger._logger = self._logger
+        global _LOGGER
+        _LOGGER = self._logger
         
-        self._logger.info("=" * 70)
-        self._logger.info("Gamba Client Logger Initialized")
-        self._logger.info("=" * 70)
+        self._logger.info("%s\nGamba Client Logger Initialized\n%s", "=" * 70, "=" * 70)
+    
+    @classmethod
+    def _stop_listener(cls, queue_handler: logging.Handler, file_handler: logging.Handler):
+        """
+        Flush queued records and switch back to direct file writes.
+        
+        Runs at exit; records logged during interpreter teardown (e.g. from
+        __del__ methods) then go straight to the file instead of the stopped queue.
+        """
+        cls._listener.stop()
+        _LOGGER.removeHandler(queue_handler)
+        _LOGGER.addHandler(file_handler)
     
     @staticmethod
     def _get_log_level(level_str: str) -> int:
         """Convert string log level to logging constant"""
-        levels = {
-            "DEBUG": logging.DEBUG,
-            "INFO": logging.INFO,
-            "WARNING": logging.WARNING,
-            "ERROR": logging.ERROR,
-            "CRITICAL": logging.CRITICAL
-        }
-        return levels.get(level_str.upper(), logging.INFO)
+        return _LOG_LEVELS.get(level_str.upper(), logging.INFO)
     
     @classmethod
     def get_logger(cls) -> logging.Logger:
         """
         Get the logger instance (singleton pattern).
-        Creates logger if it doesn't exist.
+        Creates logger if it doesn't exist - the log file is only opened on
+        first use, not when the module is imported.
         
         Returns:
             logging.Logger instance
         """
-        if cls._logger is None:
+        if _LOGGER is None:
             cls()  # Initialize
-        return cls._logger
+        return _LOGGER
     
     @classmethod
     def log_message_sent(cls, message: str):
@@ -123,10 +203,11 @@ class GameLogger:
         Args:
             message: Raw message string (without newline)
         """
-        logger = cls.get_logger()
+        logger = _LOGGER or cls.get_logger()
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
         # Remove newline for cleaner logging
-        clean_msg = message.rstrip('\n')
-        logger.debug(f"→ SEND: {clean_msg}")
+        logger.debug("→ SEND: %s", message.rstrip('\n'))
     
     @classmethod
     def log_message_received(cls, message: str):
@@ -136,9 +217,10 @@ class GameLogger:
         Args:
             message: Raw message string (without newline)
         """
-        logger = cls.get_logger()
-        clean_msg = message.rstrip('\n')
-        logger.debug(f"← RECV: {clean_msg}")
+        logger = _LOGGER or cls.get_logger()
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        logger.debug("← RECV: %s", message.rstrip('\n'))
     
     @classmethod
     def log_state_change(cls, old_state: str, new_state: str, context: str = ""):
@@ -150,11 +232,13 @@ class GameLogger:
             new_state: New state
             context: Optional context information
         """
-        logger = cls.get_logger()
+        logger = _LOGGER or cls.get_logger()
+        if not logger.isEnabledFor(logging.INFO):
+            return
         if context:
-            logger.info(f"State: {old_state} → {new_state} ({context})")
+            logger.info("State: %s → %s (%s)", old_state, new_state, context)
         else:
-            logger.info(f"State: {old_state} → {new_state}")
+            logger.info("State: %s → %s", old_state, new_state)
     
     @classmethod
     def log_connection_event(cls, event: str, details: str = ""):
@@ -165,11 +249,13 @@ class GameLogger:
             event: Event type (e.g., "CONNECTED", "DISCONNECTED", "TIMEOUT")
             details: Additional details
         """
-        logger = cls.get_logger()
+        logger = _LOGGER or cls.get_logger()
+        if not logger.isEnabledFor(logging.INFO):
+            return
         if details:
-            logger.info(f"Connection: {event} - {details}")
+            logger.info("Connection: %s - %s", event, details)
         else:
-            logger.info(f"Connection: {event}")
+            logger.info("Connection: %s", event)
     
     @classmethod
     def log_game_event(cls, event: str, details: str = ""):
@@ -180,11 +266,13 @@ class GameLogger:
             event: Event type (e.g., "GAME_STARTED", "CARD_PLAYED", "GAME_OVER")
             details: Additional details
         """
-        logger = cls.get_logger()
+        logger = _LOGGER or cls.get_logger()
+        if not logger.isEnabledFor(logging.INFO):
+            return
         if details:
-            logger.info(f"Game: {event} - {details}")
+            logger.info("Game: %s - %s", event, details)
         else:
-            logger.info(f"Game: {event}")
+            logger.info("Game: %s", event)
     
     @classmethod
     def log_error(cls, error: str, exception: Optional[Exception] = None):
@@ -195,11 +283,11 @@ class GameLogger:
             error: Error message
             exception: Optional exception object
         """
-        logger = cls.get_logger()
+        logger = _LOGGER or cls.get_logger()
         if exception:
-            logger.error(f"{error}: {exception}", exc_info=True)
+            logger.error("%s: %s", error, exception, exc_info=True)
         else:
-            logger.error(error)
+            logger.error("%s", error)
     
     @classmethod
     def log_validation_error(cls, message: str, reason: str):
@@ -210,14 +298,18 @@ class GameLogger:
             message: The invalid message
             reason: Why it's invalid
         """
-        logger = cls.get_logger()
-        logger.warning(f"Invalid message: {reason} | Message: {message}")
+        logger = _LOGGER or cls.get_logger()
+        if not logger.isEnabledFor(logging.WARNING):
+            return
+        logger.warning("Invalid message: %s | Message: %s", reason, message)
 
 
 # Convenience functions for direct import
 def get_logger() -> logging.Logger:
     """Get the game logger instance"""
-    return GameLogger.get_logger()
+    if _LOGGER is None:
+        GameLogger()
+    return _LOGGER
 
 
 def log_message_sent(message: str):
@@ -254,6 +346,3 @@ def log_validation_error(message: str, reason: str):
     """Log validation error"""
     GameLogger.log_validation_error(message, reason)
 
-
-# Initialize logger on module import
-GameLogger()